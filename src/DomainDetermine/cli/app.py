@@ -3,51 +3,69 @@
 from __future__ import annotations
 
 import hashlib
+import inspect
 import json
+import os
+import string
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 import typer
+from typer.models import ParameterInfo
 
-# Prompt governance utilities
-from DomainDetermine.governance.event_log import GovernanceEventLog
+# Prompt governance utilities. ChangeImpact must stay importable at module scope
+# because Typer resolves it from the command signature; the rest load on demand.
 from DomainDetermine.governance.versioning import ChangeImpact
-from DomainDetermine.prompt_pack.registry import (
-    PromptManifest,
-    PromptRegistry,
-    PromptRegistryError,
-)
-from DomainDetermine.prompt_pack.versioning import PromptVersionManager
 
 from .config import ResolvedConfig, load_cli_config, write_current_context
-from .logging import configure_logging
-from .operations import CommandRuntime, OperationExecutor, build_runtime
-from .plugins import PluginExecutionError, describe_plugin_trust
-from .plugins import registry as plugin_registry
-from .profiles import (
-    PATH_ARGUMENT_KEYS,
-    ensure_version_compat,
-    load_profile,
-    resolve_profile_path,
-    validate_profile,
-)
-from .safety import (
-    PreflightChecks,
-    PreflightError,
-    ResourceGuard,
-    require_confirmation,
-    validate_credentials_reference,
+from .logging import configure_logging, shutdown_logging
+from .operations import OperationExecutor, build_runtime
+from .serialization import (
+    COMPRESSION_SUFFIXES,
+    atomic_write_bytes,
+    compress_bytes,
+    dumps_pretty,
+    echo_json,
 )
 
+# Plugin, profile, and safety helpers are imported inside the commands that use
+# them so start-up paths such as ``--help`` and ``context list`` stay lean.
+if TYPE_CHECKING:
+    from DomainDetermine.prompt_pack.registry import PromptRegistry
+
+    from .operations import CommandRuntime
+    from .profiles import ProfileManifest, ProfileStep
+
 # Mapping pipeline integration is optional and configured via register_mapping_pipeline_builder.
 
 CLI_VERSION = "0.1.0"
 
-app = typer.Typer(help="DomainDetermine command line interface")
-context_app = typer.Typer(help="Manage CLI contexts")
-plugins_app = typer.Typer(help="Inspect and manage CLI plugins")
-profile_app = typer.Typer(help="Execute bundled CLI profiles")
-prompt_app = typer.Typer(help="Prompt pack governance operations")
+# Artifacts smaller than this are always written uncompressed.
+ARTIFACT_COMPRESSION_THRESHOLD = 4096
+
+# Shell completion, Rich markup, and pretty tracebacks add start-up work to every
+# invocation without benefiting scripted usage, so they are disabled app-wide.
+_TYPER_SETTINGS: Dict[str, Any] = {
+    "add_completion": False,
+    "no_args_is_help": False,
+    "pretty_exceptions_enable": False,
+    "rich_markup_mode": None,
+}
+
+app = typer.Typer(help="DomainDetermine command line interface", **_TYPER_SETTINGS)
+context_app = typer.Typer(help="Manage CLI contexts", **_TYPER_SETTINGS)
+plugins_app = typer.Typer(help="Inspect and manage CLI plugins", **_TYPER_SETTINGS)
+profile_app = typer.Typer(help="Execute bundled CLI profiles", **_TYPER_SETTINGS)
+prompt_app = typer.Typer(help="Prompt pack governance operations", **_TYPER_SETTINGS)
 
 app.add_typer(context_app, name="context")
 app.add_typer(plugins_app, name="plugins")
@@ -68,51 +86,98 @@ def _resolve_config(
     dry_run: bool,
     log_format: str,
     verbose: bool,
+    artifact_compression: Optional[str] = None,
 ) -> ResolvedConfig:
     if credentials_ref:
+        from .safety import validate_credentials_reference
+
         validate_credentials_reference(credentials_ref)
 
-    overrides = {
-        "context": context,
-        "artifact_root": artifact_root,
-        "registry_url": registry_url,
-        "credentials_ref": credentials_ref,
-        "dry_run": dry_run,
-        "log_format": log_format,
-        "verbose": verbose,
-    }
-    overrides = {k: v for k, v in overrides.items() if v not in {None, False, ""}}
+    # Only flags the operator actually set become overrides; unset or falsy
+    # values fall through to env and config-file precedence.
+    overrides: Dict[str, Any] = {}
+    if context:
+        overrides["context"] = context
+    if artifact_root is not None:
+        overrides["artifact_root"] = artifact_root
+    if registry_url:
+        overrides["registry_url"] = registry_url
+    if credentials_ref:
+        overrides["credentials_ref"] = credentials_ref
+    if dry_run:
+        overrides["dry_run"] = True
+    if log_format:
+        overrides["log_format"] = log_format
+    if verbose:
+        overrides["verbose"] = True
+    if artifact_compression:
+        overrides["artifact_compression"] = artifact_compression
     resolved = load_cli_config(config, overrides=overrides)
     state_env = {"DD_CONTEXT_HOME": str(resolved.state_path.parent)}
     write_current_context(state_env, resolved.context.name)
     return resolved
 
 
-def _normalise_payload(values: Dict[str, Any]) -> Dict[str, Any]:
-    normalised: Dict[str, Any] = {}
-    for key, value in values.items():
-        if isinstance(value, Path):
-            normalised[key] = str(value)
-        elif isinstance(value, dict):
-            normalised[key] = _normalise_payload(value)
-        elif isinstance(value, (list, tuple)):
-            normalised[key] = [str(item) if isinstance(item, Path) else item for item in value]
-        else:
-            normalised[key] = value
-    return normalised
+_SLUG_SAFE_ASCII = frozenset(string.ascii_lowercase + string.digits + "-_")
+_SLUG_TABLE = str.maketrans(
+    {chr(code): "-" for code in range(128) if chr(code) not in _SLUG_SAFE_ASCII}
+)
 
 
 def _slug(identifier: str) -> str:
-    cleaned = identifier.strip().lower().replace(" ", "-")
-    safe = [c if c.isalnum() or c in {"-", "_"} else "-" for c in cleaned]
-    collapsed = "".join(safe).strip("-")
+    cleaned = identifier.strip().lower()
+    if cleaned.isascii():
+        collapsed = cleaned.translate(_SLUG_TABLE).strip("-")
+    else:
+        # Unicode letters and digits are kept, which the ASCII table cannot express.
+        safe = [c if c.isalnum() or c in {"-", "_"} else "-" for c in cleaned]
+        collapsed = "".join(safe).strip("-")
     return collapsed or "artifact"
 
 
+# Digests of files hashed during this process, keyed by (resolved path, device,
+# inode, mtime_ns, size) so profile steps that reference the same input do not
+# re-read it; the inode catches files swapped in by rename with the old mtime.
+# Least recently used entries are evicted beyond ``_HASH_CACHE_SIZE``.
+_HASH_CACHE: OrderedDict[Tuple[str, int, int, int, int], str] = OrderedDict()
+_HASH_CACHE_SIZE = 1024
+_HASH_CACHE_LOCK = threading.Lock()
+# Files modified this recently are not cached: a same-size rewrite within one
+# mtime tick would otherwise keep the old digest (git's "racily clean" case).
+_HASH_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
 def _hash_path(path: Path) -> str:
-    if path.exists() and path.is_file():
-        return hashlib.sha256(path.read_bytes()).hexdigest()
-    return hashlib.sha256(str(path).encode("utf-8")).hexdigest()
+    # Stat before opening: FIFOs, devices, and other non-regular files would
+    # block or be consumed by a read, so they hash by name like missing paths
+    # and directories. The same stat result supplies the cache key.
+    try:
+        stat = path.stat()
+        if not S_ISREG(stat.st_mode):
+            return hashlib.sha256(str(path).encode("utf-8")).hexdigest()
+        key = (
+            str(path.resolve()),
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        with _HASH_CACHE_LOCK:
+            digest = _HASH_CACHE.get(key)
+            if digest is not None:
+                _HASH_CACHE.move_to_end(key)
+                return digest
+        # Stream through a reusable buffer rather than loading the whole file.
+        with path.open("rb") as handle:
+            digest = hashlib.file_digest(handle, "sha256").hexdigest()
+        if time.time_ns() - stat.st_mtime_ns >= _HASH_CACHE_MIN_AGE_NS:
+            with _HASH_CACHE_LOCK:
+                _HASH_CACHE[key] = digest
+                if len(_HASH_CACHE) > _HASH_CACHE_SIZE:
+                    _HASH_CACHE.popitem(last=False)
+        return digest
+    except (FileNotFoundError, NotADirectoryError):
+        return hashlib.sha256(str(path).encode("utf-8")).hexdigest()
 
 
 def _write_artifact(
@@ -126,13 +191,20 @@ def _write_artifact(
     subject_path = Path(subject)
     base_name = subject_path.stem if subject_path.suffix else subject_path.name
     artifact_path = artifact_dir / f"{_slug(base_name)}.json"
+    # Keys are listed alphabetically and ``payload`` is sorted once here, so the
+    # encoder does not need to sort; ``default=str`` renders Path values.
     artifact_payload = {
-        "verb": verb,
-        "subject": subject,
-        "context": resolved.context.name,
-        "inputs": payload,
+        "context": sys.intern(resolved.context.name),
+        "inputs": dict(sorted(payload.items())),
+        "subject": sys.intern(subject),
+        "verb": sys.intern(verb),
     }
-    artifact_path.write_text(json.dumps(artifact_payload, indent=2, sort_keys=True), encoding="utf-8")
+    data = dumps_pretty(artifact_payload, sort_keys=False, default=str)
+    codec = resolved.artifact_compression
+    if codec != "none" and len(data) > ARTIFACT_COMPRESSION_THRESHOLD:
+        data = compress_bytes(data, codec)
+        artifact_path = artifact_path.with_name(artifact_path.name + COMPRESSION_SUFFIXES[codec])
+    atomic_write_bytes(artifact_path, data)
     return artifact_path
 
 
@@ -152,8 +224,18 @@ def _execute_command(
 ) -> None:
     runtime = runtime or build_runtime(ctx)
     executor = OperationExecutor(runtime)
-    payload = _normalise_payload(payload)
-    preview = f"Would {verb} {subject} with {payload}"
+    # Verbs and subjects recur across profile steps, manifests, and artifacts;
+    # interning keeps a single canonical copy for dict lookups and encoding.
+    verb = sys.intern(verb)
+    subject = sys.intern(subject)
+    shown = {
+        key: str(value) if isinstance(value, Path) else value for key, value in payload.items()
+    }
+    preview = f"Would {verb} {subject} with {shown}"
+    if runtime.dry_run:
+        # Dry runs never call a performer, so skip building the default one.
+        executor.preview(verb, subject, payload, preview)
+        return
 
     def default_performer() -> Optional[Path]:
         return _write_artifact(runtime.config, verb, subject, payload)
@@ -162,13 +244,13 @@ def _execute_command(
 
 
 def _prepare_profile_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    prepared: Dict[str, Any] = {}
-    for key, value in arguments.items():
-        if key in PATH_ARGUMENT_KEYS and isinstance(value, str):
-            prepared[key] = Path(value)
-        else:
-            prepared[key] = value
-    return prepared
+    from .profiles import PATH_ARGUMENT_KEYS
+
+    # Manifest values come straight from TOML, so an exact ``str`` type check suffices.
+    return {
+        key: Path(value) if key in PATH_ARGUMENT_KEYS and type(value) is str else value
+        for key, value in arguments.items()
+    }
 
 
 def _command_callable(verb: str) -> Callable[..., Any]:
@@ -241,6 +323,10 @@ def bump_prompt_version(
 ) -> None:
     """Validate, hash, and log a prompt version bump."""
 
+    from DomainDetermine.governance.event_log import GovernanceEventLog
+    from DomainDetermine.prompt_pack.registry import PromptRegistryError
+    from DomainDetermine.prompt_pack.versioning import PromptVersionManager
+
     expected_metrics = _parse_metrics(metrics)
     registry = _load_prompt_registry(prompt_root, journal_path)
     event_log: Optional[GovernanceEventLog] = None
@@ -274,25 +360,24 @@ def bump_prompt_version(
         raise typer.Exit(code=1)
 
     reference = manager.reference(manifest)
-    typer.echo(
-        json.dumps(
-            {
-                "template_id": manifest.template_id,
-                "version": manifest.version,
-                "hash": manifest.hash,
-                "reference": reference,
-                "changelog": str(changelog_path),
-                "journal": str(journal_path),
-                "event_log": str(event_log_path) if event_log_path else None,
-            },
-            indent=2,
-            sort_keys=True,
-        )
+    echo_json(
+        {
+            "changelog": str(changelog_path),
+            "event_log": str(event_log_path) if event_log_path else None,
+            "hash": manifest.hash,
+            "journal": str(journal_path),
+            "reference": reference,
+            "template_id": manifest.template_id,
+            "version": manifest.version,
+        },
+        sort_keys=False,
     )
 
 def _load_prompt_registry(prompt_root: Path, journal_path: Optional[Path]) -> PromptRegistry:
     """Initialise a prompt registry with optional historical records."""
 
+    from DomainDetermine.prompt_pack.registry import PromptManifest, PromptRegistry
+
     registry = PromptRegistry()
     if journal_path and journal_path.exists():
         with journal_path.open("r", encoding="utf-8") as handle:
@@ -355,6 +440,11 @@ def main_callback(
     ),
     log_format: str = typer.Option("text", "--log-format", help="Log format for file output (text or json)."),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging."),
+    artifact_compression: Optional[str] = typer.Option(
+        None,
+        "--artifact-compression",
+        help="Compress large artifacts (none, gzip, or zstd).",
+    ),
 ) -> None:
     """Top-level callback to resolve configuration and configure logging."""
 
@@ -367,11 +457,13 @@ def main_callback(
         dry_run=dry_run,
         log_format=log_format,
         verbose=verbose,
+        artifact_compression=artifact_compression,
     )
 
     log_dir = resolved.artifact_root / "logs"
     log_path = log_dir / "cli.log"
     logger = configure_logging(log_path, resolved.log_format, resolved.verbose)
+    ctx.call_on_close(shutdown_logging)
     ctx.obj = {"config": resolved, "logger": logger, "mapping_pipeline": None}
 
     if mapping_pipeline_builder is not None:
@@ -388,9 +480,12 @@ def context_list(ctx: typer.Context) -> None:
     """List configured contexts."""
 
     resolved: ResolvedConfig = ctx.obj["config"]
-    for name in sorted(resolved.contexts.keys()):
-        prefix = "*" if name == resolved.context.name else " "
-        typer.echo(f"{prefix} {name}")
+    active = resolved.context.name
+    typer.echo(
+        "\n".join(
+            f"{'*' if name == active else ' '} {name}" for name in resolved.sorted_context_names
+        )
+    )
 
 
 @context_app.command("use")
@@ -415,16 +510,16 @@ def context_show(ctx: typer.Context, name: Optional[str] = None) -> None:
     ctx_config = resolved.contexts[target]
     payload = {
         "artifact_root": str(ctx_config.artifact_root),
-        "registry_url": ctx_config.registry_url,
         "credentials_ref": ctx_config.credentials_ref,
         "log_level": ctx_config.log_level,
         "policy": {
-            "license_flags": list(ctx_config.policy.license_flags),
-            "forbidden_topics": list(ctx_config.policy.forbidden_topics),
+            "forbidden_topics": sorted(ctx_config.policy.forbidden_topics),
+            "license_flags": sorted(ctx_config.policy.license_flags),
             "max_batch_size": ctx_config.policy.max_batch_size,
         },
+        "registry_url": ctx_config.registry_url,
     }
-    typer.echo(json.dumps(payload, indent=2, sort_keys=True))
+    echo_json(payload, sort_keys=False)
 
 
 # ---------------------------------------------------------------------------
@@ -441,22 +536,26 @@ def plugins_list(
 ) -> None:
     """List registered CLI plugins."""
 
+    from .plugins import describe_plugin_trust
+    from .plugins import registry as plugin_registry
+
     runtime = build_runtime(ctx)
-    categories = [category] if category else list(plugin_registry.categories)
-    for idx, cat in enumerate(categories):
-        wrappers = plugin_registry.list_plugins(
-            cat, runtime.logger, runtime.config.plugin_trust
-        )
-        typer.echo(f"[{cat}]")
+    trust_policy = runtime.config.plugin_trust
+    listing = plugin_registry.list_all(
+        runtime.logger, trust_policy, [category] if category else None
+    )
+
+    def render(cat: str, wrappers: List[Any]) -> str:
+        lines = [f"[{cat}]"]
         if not wrappers:
-            typer.echo("  (none)")
-        else:
-            for wrapper in wrappers:
-                trust_label = describe_plugin_trust(wrapper, runtime.config.plugin_trust)
-                status_suffix = "" if trust_label == "trusted" else f" [{trust_label}]"
-                typer.echo(f"  - {wrapper.name} (v{wrapper.version}){status_suffix}")
-        if idx < len(categories) - 1:
-            typer.echo("")
+            lines.append("  (none)")
+        for wrapper in wrappers:
+            trust_label = describe_plugin_trust(wrapper, trust_policy)
+            status_suffix = "" if trust_label == "trusted" else f" [{trust_label}]"
+            lines.append(f"  - {wrapper.name} (v{wrapper.version}){status_suffix}")
+        return "\n".join(lines)
+
+    typer.echo("\n\n".join(render(cat, wrappers) for cat, wrappers in listing.items()))
 
 
 # ---------------------------------------------------------------------------
@@ -465,9 +564,24 @@ def plugins_list(
 
 
 @profile_app.command("run")
-def profile_run(ctx: typer.Context, identifier: str = typer.Argument(...)) -> None:
+def profile_run(
+    ctx: typer.Context,
+    identifier: str = typer.Argument(...),
+    parallel: bool = typer.Option(
+        False,
+        "--parallel",
+        help="Run steps concurrently, honouring each step's depends_on list.",
+    ),
+) -> None:
     """Execute a named profile manifest."""
 
+    from .profiles import (
+        ensure_version_compat,
+        load_profile,
+        resolve_profile_path,
+        validate_profile,
+    )
+
     runtime = build_runtime(ctx)
     manifest_path = resolve_profile_path(runtime.config, identifier)
     manifest = load_profile(manifest_path)
@@ -482,20 +596,105 @@ def profile_run(ctx: typer.Context, identifier: str = typer.Argument(...)) -> No
         formatted = "; ".join(validation_errors)
         raise typer.BadParameter(f"Profile manifest validation failed: {formatted}")
 
-    typer.echo(f"Profile: {manifest.name}")
-    typer.echo(f"Source: {manifest_path}")
-    typer.echo("Steps:")
-    for line in manifest.describe():
-        typer.echo(f"  {line}")
+    lines = [f"Profile: {manifest.name}", f"Source: {manifest_path}", "Steps:"]
+    lines.extend(f"  {line}" for line in manifest.describe())
+    typer.echo("\n".join(lines))
 
     if runtime.dry_run:
         typer.echo("[dry-run] Profile execution skipped")
         return
 
+    _prehash_profile_inputs(manifest)
+    if parallel or runtime.config.profile_parallel:
+        _run_profile_parallel(ctx, manifest)
+        return
+
     for step in manifest.steps:
-        handler = _command_callable(step.verb)
-        args = _prepare_profile_arguments(step.arguments)
-        ctx.invoke(handler, **args)
+        _invoke_profile_step(ctx, step)
+
+
+def _prehash_profile_inputs(manifest: ProfileManifest) -> None:
+    """Warm the digest cache for the input each profile step will fingerprint.
+
+    ``hashlib`` releases the GIL while digesting, so hashing the inputs together
+    up front costs roughly the slowest file rather than the sum; each step's own
+    ``_hash_path`` call then hits ``_HASH_CACHE``. Only the argument a verb
+    actually hashes is read, never outputs or other path arguments.
+    """
+
+    paths = set()
+    for step in manifest.steps:
+        argument = _HASHED_INPUT_ARGUMENTS.get(step.verb)
+        if argument is None:
+            continue
+        value = _prepare_profile_arguments(step.arguments).get(argument)
+        if isinstance(value, Path):
+            paths.add(value)
+    if len(paths) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        # Unreadable inputs are reported by the step that uses them.
+        list(pool.map(_safe_hash_path, paths))
+
+
+def _safe_hash_path(path: Path) -> Optional[str]:
+    try:
+        return _hash_path(path)
+    except OSError:
+        return None
+
+
+def _invoke_profile_step(ctx: typer.Context, step: ProfileStep) -> None:
+    """Invoke a step's command, filling omitted options with their Typer defaults."""
+
+    handler = _command_callable(step.verb)
+    arguments = {**_command_defaults(handler), **_prepare_profile_arguments(step.arguments)}
+    ctx.invoke(handler, ctx, **arguments)
+
+
+@lru_cache(maxsize=64)
+def _command_defaults(handler: Callable[..., Any]) -> Mapping[str, Any]:
+    """Return the Typer default of each option a command declares, once per handler."""
+
+    return MappingProxyType(
+        {
+            name: parameter.default.default
+            for name, parameter in inspect.signature(handler).parameters.items()
+            if name != "ctx" and isinstance(parameter.default, ParameterInfo)
+        }
+    )
+
+
+def _run_profile_parallel(ctx: typer.Context, manifest: ProfileManifest) -> None:
+    """Execute profile steps wave by wave, running each wave on a thread pool.
+
+    Steps share the context object and the queued log handler, neither of which
+    can cross a process boundary, so threads are used; hashing and artifact I/O
+    release the GIL. Each step runs in its own child context so concurrent
+    ``invoke`` calls never race on the parent's depth counter (which would close
+    it, and run its cleanup callbacks, mid-run). Spinners are suppressed because
+    only one can be live.
+    """
+
+    from .profiles import schedule_profile_steps
+
+    runtime = build_runtime(ctx)
+    ctx.obj["runtime"] = replace(runtime, show_progress=False)
+    try:
+        for wave in schedule_profile_steps(manifest):
+            with ThreadPoolExecutor(max_workers=min(len(wave), os.cpu_count() or 1)) as pool:
+                futures = [
+                    pool.submit(_invoke_profile_step, _step_context(ctx, step), step)
+                    for step in wave
+                ]
+                for future in futures:
+                    future.result()
+    finally:
+        ctx.obj["runtime"] = runtime
+
+
+def _step_context(ctx: typer.Context, step: ProfileStep) -> typer.Context:
+    return typer.Context(ctx.command, parent=ctx, info_name=step.verb, obj=ctx.obj)
 
 
 # ---------------------------------------------------------------------------
@@ -511,6 +710,9 @@ def ingest(
 ) -> None:
     """Run ingestion for a given source configuration."""
 
+    from .plugins import PluginExecutionError
+    from .plugins import registry as plugin_registry
+
     runtime = build_runtime(ctx)
     payload = {
         "source": source,
@@ -521,7 +723,7 @@ def ingest(
         payload["loader"] = loader
 
     def performer() -> Optional[Path]:
-        artifact_path = _write_artifact(runtime.config, "ingest", str(source), _normalise_payload(payload))
+        artifact_path = _write_artifact(runtime.config, "ingest", str(source), payload)
         if loader:
             plugin_payload = {
                 "source": str(source),
@@ -594,6 +796,8 @@ def map(
         None, help="Override the configured max batch guardrail."
     ),
 ) -> None:
+    from .safety import PreflightError, ResourceGuard
+
     runtime = build_runtime(ctx)
     guard = ResourceGuard(runtime.config.context.policy)
     try:
@@ -654,48 +858,84 @@ def calibrate_mapping(
             "correct": result.correct,
             "metrics": dict(result.metrics),
         }
-        metrics_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        metrics_path.write_bytes(dumps_pretty(payload))
         return metrics_path
 
     _execute_command(ctx, "calibrate_mapping", str(mapping_file), payload, runtime=runtime, performer=performer)
 
 
-@app.command()
-def expand(
-    ctx: typer.Context,
-    ontology: Path = typer.Argument(..., help="Ontology expansion configuration"),
-) -> None:
-    payload = {
-        "ontology": ontology,
-        "hash": _hash_path(ontology),
-    }
-    _execute_command(ctx, "expand", str(ontology), payload)
+@dataclass(frozen=True, slots=True)
+class _HashedVerbSpec:
+    """Declarative description of a verb that hashes one input file and records it."""
 
+    verb: str
+    argument: str
+    help: str
+    options: Tuple[Tuple[str, type, Any, str], ...] = ()
 
-@app.command()
-def certify(
-    ctx: typer.Context,
-    dossier: Path = typer.Argument(..., help="Certification dossier path"),
-) -> None:
-    payload = {
-        "dossier": dossier,
-        "hash": _hash_path(dossier),
-    }
-    _execute_command(ctx, "certify", str(dossier), payload)
 
+# Verbs whose behaviour is exactly "hash the input, record an artifact" share one
+# generated implementation instead of near-identical hand-written wrappers.
+_HASHED_VERB_SPECS: Tuple[_HashedVerbSpec, ...] = (
+    _HashedVerbSpec("expand", "ontology", "Ontology expansion configuration"),
+    _HashedVerbSpec("certify", "dossier", "Certification dossier path"),
+    _HashedVerbSpec(
+        "evalgen",
+        "config",
+        "Evaluation generation config",
+        options=(("sample", int, 10, "Sample size for evaluation generation"),),
+    ),
+    _HashedVerbSpec("run", "workflow", "Workflow file to execute"),
+)
 
-@app.command()
-def evalgen(
-    ctx: typer.Context,
-    config: Path = typer.Argument(..., help="Evaluation generation config"),
-    sample: int = typer.Option(10, help="Sample size for evaluation generation"),
-) -> None:
-    payload = {
-        "config": config,
-        "hash": _hash_path(config),
-        "sample": sample,
-    }
-    _execute_command(ctx, "evalgen", str(config), payload)
+# The argument each verb passes to ``_hash_path``; profile runs prehash only these.
+_HASHED_INPUT_ARGUMENTS: Dict[str, str] = {
+    "ingest": "source",
+    "plan": "plan_spec",
+    "map": "mapping_file",
+    "calibrate_mapping": "gold",
+    **{spec.verb: spec.argument for spec in _HASHED_VERB_SPECS},
+}
+
+
+def _register_hashed_verb(spec: _HashedVerbSpec) -> Callable[..., None]:
+    def command(ctx: typer.Context, **arguments: Any) -> None:
+        source = arguments[spec.argument]
+        payload: Dict[str, Any] = {spec.argument: source, "hash": _hash_path(source)}
+        for name, *_ in spec.options:
+            payload[name] = arguments[name]
+        _execute_command(ctx, spec.verb, str(source), payload)
+
+    keyword = inspect.Parameter.KEYWORD_ONLY
+    parameters = [
+        inspect.Parameter("ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=typer.Context),
+        inspect.Parameter(
+            spec.argument,
+            keyword,
+            default=typer.Argument(..., help=spec.help),
+            annotation=Path,
+        ),
+    ]
+    parameters.extend(
+        inspect.Parameter(
+            name,
+            keyword,
+            default=typer.Option(default, help=help_text),
+            annotation=annotation,
+        )
+        for name, annotation, default, help_text in spec.options
+    )
+    # Typer and profile validation both introspect the signature, so the generated
+    # command advertises the same parameters a hand-written wrapper would.
+    command.__signature__ = inspect.Signature(parameters, return_annotation=None)  # type: ignore[attr-defined]
+    command.__annotations__ = {parameter.name: parameter.annotation for parameter in parameters}
+    command.__name__ = command.__qualname__ = spec.verb
+    return app.command(name=spec.verb)(command)
+
+
+for _spec in _HASHED_VERB_SPECS:
+    globals()[_spec.verb] = _register_hashed_verb(_spec)
+del _spec
 
 
 @app.command()
@@ -705,6 +945,8 @@ def publish(
     channel: str = typer.Option("stable", help="Publish channel"),
     yes: bool = typer.Option(False, "--yes", help="Skip confirmation prompt."),
 ) -> None:
+    from .safety import PreflightChecks, PreflightError, require_confirmation
+
     runtime = build_runtime(ctx)
     payload = {
         "artifact": artifact,
@@ -740,6 +982,8 @@ def rollback(
     snapshot_name: Optional[str] = typer.Option(None, help="Snapshot to restore"),
     yes: bool = typer.Option(False, "--yes", help="Skip confirmation prompt."),
 ) -> None:
+    from .safety import PreflightChecks, PreflightError, require_confirmation
+
     runtime = build_runtime(ctx)
     payload = {
         "artifact": artifact,
@@ -754,18 +998,6 @@ def rollback(
     _execute_command(ctx, "rollback", artifact, payload, runtime=runtime)
 
 
-@app.command()
-def run(
-    ctx: typer.Context,
-    workflow: Path = typer.Argument(..., help="Workflow file to execute"),
-) -> None:
-    payload = {
-        "workflow": workflow,
-        "hash": _hash_path(workflow),
-    }
-    _execute_command(ctx, "run", str(workflow), payload)
-
-
 @app.command()
 def report(
     ctx: typer.Context,
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import json
 import os
-import string
-import tomllib
 from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .serialization import atomic_write_bytes, loads_json
 
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "domain_determinate" / "cli.toml"
 DEFAULT_STATE_HOME = Path.home() / ".domain_determinate"
 CONTEXT_FILENAME = "context"
+ARTIFACT_COMPRESSION_CODECS = ("none", "gzip", "zstd")
 
 
 def _expand(path: Optional[str | Path], base: Optional[Path]) -> Optional[Path]:
@@ -28,7 +30,11 @@ def _expand(path: Optional[str | Path], base: Optional[Path]) -> Optional[Path]:
 
 @dataclass(frozen=True)
 class ContextPolicy:
-    """Safety-rail configuration for a CLI context."""
+    """Safety-rail configuration for a CLI context.
+
+    Flags and topics keep their configured order; use the ``*_set`` views for
+    membership checks and sort at output boundaries.
+    """
 
     license_flags: tuple[str, ...] = tuple()
     forbidden_topics: tuple[str, ...] = tuple()
@@ -37,6 +43,18 @@ class ContextPolicy:
     default_timeout_seconds: int = 300
     rate_limit_backoff: float = 1.5
 
+    @cached_property
+    def license_flag_set(self) -> frozenset[str]:
+        """License flags as a set for constant-time membership checks."""
+
+        return frozenset(self.license_flags)
+
+    @cached_property
+    def forbidden_topic_set(self) -> frozenset[str]:
+        """Lower-cased forbidden topics, matching how payloads are compared."""
+
+        return frozenset(topic.lower() for topic in self.forbidden_topics)
+
 
 @dataclass(frozen=True)
 class ContextConfig:
@@ -64,7 +82,7 @@ class ResolvedConfig:
     """Final configuration used during a CLI invocation."""
 
     context: ContextConfig
-    contexts: Dict[str, ContextConfig]
+    contexts: Mapping[str, ContextConfig]
     dry_run: bool
     log_format: str
     verbose: bool
@@ -73,6 +91,14 @@ class ResolvedConfig:
     state_path: Path
     raw_overrides: Dict[str, Any]
     plugin_trust: "PluginTrustPolicy"
+    profile_parallel: bool = False
+    artifact_compression: str = "none"
+
+    @cached_property
+    def sorted_context_names(self) -> tuple[str, ...]:
+        """Context names in display order, computed once per configuration."""
+
+        return tuple(sorted(self.contexts))
 
 
 @dataclass(frozen=True)
@@ -96,40 +122,67 @@ class PluginTrustPolicy:
             signature_allowlist=updated_signatures,
         )
 
+    @cached_property
+    def trusted_names(self) -> frozenset[str]:
+        """Names present in the signature allowlist."""
 
-def _parse_policy(data: Optional[Mapping[str, Any]], base_dir: Path) -> ContextPolicy:
-    if not data:
-        return ContextPolicy()
-    license_flags = tuple(
-        sorted(filter(None, (flag.strip() for flag in data.get("license_flags", []))))
-    )
-    forbidden_topics = tuple(
-        sorted(filter(None, (topic.strip() for topic in data.get("forbidden_topics", []))))
-    )
-    integrity_markers = tuple(
-        filter(
-            None,
-            (
-                _expand(marker, base_dir)
-                for marker in data.get("integrity_markers", []) or []
+        return frozenset(self.signature_allowlist)
+
+    @cached_property
+    def normalized_allowlist(self) -> Dict[str, bytes]:
+        """Allowlisted digests decoded to raw bytes for constant-time comparison."""
+
+        return {name: _digest_bytes(value) for name, value in self.signature_allowlist.items()}
+
+
+def _digest_bytes(value: str) -> bytes:
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        # Not a hex digest, so it can never match a computed one.
+        return value.encode("utf-8")
+
+
+_DEFAULT_POLICY = ContextPolicy()
+
+
+def _build_context(name: str, ctx_data: Mapping[str, Any], base_dir: Path) -> ContextConfig:
+    """Build a context and its policy from one ``[contexts.<name>]`` table."""
+
+    artifact_root = _expand(ctx_data.get("artifact_root"), base_dir)
+    if artifact_root is None:
+        raise ValueError(f"Context '{name}' missing artifact_root")
+    policy_data = ctx_data.get("policy")
+    if policy_data:
+        flags = (flag.strip() for flag in policy_data.get("license_flags", []))
+        topics = (topic.strip() for topic in policy_data.get("forbidden_topics", []))
+        markers = (_expand(raw, base_dir) for raw in policy_data.get("integrity_markers") or [])
+        policy = ContextPolicy(
+            license_flags=tuple(filter(None, flags)),
+            forbidden_topics=tuple(filter(None, topics)),
+            integrity_markers=tuple(filter(None, markers)),
+            max_batch_size=int(policy_data.get("max_batch_size", _DEFAULT_POLICY.max_batch_size)),
+            default_timeout_seconds=int(
+                policy_data.get("default_timeout_seconds", _DEFAULT_POLICY.default_timeout_seconds)
+            ),
+            rate_limit_backoff=float(
+                policy_data.get("rate_limit_backoff", _DEFAULT_POLICY.rate_limit_backoff)
             ),
         )
+    else:
+        policy = _DEFAULT_POLICY
+    return ContextConfig(
+        name=name,
+        artifact_root=artifact_root,
+        registry_url=ctx_data.get("registry_url"),
+        credentials_ref=ctx_data.get("credentials_ref"),
+        log_level=ctx_data.get("log_level", "INFO"),
+        policy=policy,
     )
-    max_batch_size = int(data.get("max_batch_size", ContextPolicy().max_batch_size))
-    default_timeout = int(
-        data.get("default_timeout_seconds", ContextPolicy().default_timeout_seconds)
-    )
-    rate_limit_backoff = float(
-        data.get("rate_limit_backoff", ContextPolicy().rate_limit_backoff)
-    )
-    return ContextPolicy(
-        license_flags=license_flags,
-        forbidden_topics=forbidden_topics,
-        integrity_markers=integrity_markers,
-        max_batch_size=max_batch_size,
-        default_timeout_seconds=default_timeout,
-        rate_limit_backoff=rate_limit_backoff,
-    )
+
+
+# Tokens are lower-cased before validation, so only lower-case digits are needed.
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
 
 def _normalise_signature(value: str) -> str:
@@ -141,7 +194,7 @@ def _normalise_signature(value: str) -> str:
         if algorithm != "sha256":
             raise ValueError("Only sha256 plugin signatures are supported")
         token = digest
-    if len(token) != 64 or any(ch not in string.hexdigits for ch in token):
+    if len(token) != 64 or not _HEX_DIGITS.issuperset(token):
         raise ValueError("Plugin signature must be a 64 character hex digest")
     return token
 
@@ -164,32 +217,33 @@ def _parse_plugin_trust(data: Optional[Mapping[str, Any]]) -> PluginTrustPolicy:
 
 
 def _load_file_config(path: Path) -> CLIConfig:
+    stat = path.stat()
+    return _load_file_config_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# Keyed on modification time and size so an edited file is re-parsed; callers
+# only expose ``contexts`` read-only, keeping the cached CLIConfig intact.
+@lru_cache(maxsize=8)
+def _load_file_config_cached(path_str: str, mtime_ns: int, size: int) -> CLIConfig:
+    path = Path(path_str)
     data: Dict[str, Any]
     suffix = path.suffix.lower()
     content = path.read_bytes()
     if suffix == ".json":
-        data = json.loads(content)
+        data = loads_json(content)
     elif suffix in {".toml", ".tml"}:
+        import tomllib  # only TOML configs pay for the parser import
+
         data = tomllib.loads(content.decode("utf-8"))
     else:
         raise ValueError(f"Unsupported config format: {path.suffix}")
 
     default_ctx = data.get("default_context")
-    contexts: Dict[str, ContextConfig] = {}
     base_dir = path.parent
-    for name, ctx_data in (data.get("contexts") or {}).items():
-        artifact_root = _expand(ctx_data.get("artifact_root"), base_dir)
-        if artifact_root is None:
-            raise ValueError(f"Context '{name}' missing artifact_root")
-        policy = _parse_policy(ctx_data.get("policy"), base_dir)
-        contexts[name] = ContextConfig(
-            name=name,
-            artifact_root=artifact_root,
-            registry_url=ctx_data.get("registry_url"),
-            credentials_ref=ctx_data.get("credentials_ref"),
-            log_level=ctx_data.get("log_level", "INFO"),
-            policy=policy,
-        )
+    contexts = {
+        name: _build_context(name, ctx_data, base_dir)
+        for name, ctx_data in (data.get("contexts") or {}).items()
+    }
 
     plugin_trust = _parse_plugin_trust(data.get("plugins"))
 
@@ -235,10 +289,13 @@ def read_current_context(env: Mapping[str, str]) -> Optional[str]:
 
 
 def write_current_context(env: Mapping[str, str], context_name: str) -> None:
+    # Every invocation records its context, but it rarely changes; skip the
+    # write when the persisted value already matches.
+    if read_current_context(env) == context_name:
+        return
     home = _state_home(env)
     home.mkdir(parents=True, exist_ok=True)
-    path = home / CONTEXT_FILENAME
-    path.write_text(context_name, encoding="utf-8")
+    atomic_write_bytes(home / CONTEXT_FILENAME, context_name.encode("utf-8"))
 
 
 def _apply_env_overrides(context: ContextConfig, env: Mapping[str, str]) -> ContextConfig:
@@ -267,11 +324,11 @@ def _apply_env_overrides(context: ContextConfig, env: Mapping[str, str]) -> Cont
 
     changed = False
     if license_flags:
-        flags = tuple(sorted(flag.strip() for flag in license_flags.split(",") if flag.strip()))
+        flags = tuple(flag.strip() for flag in license_flags.split(",") if flag.strip())
         policy = replace(policy, license_flags=flags)
         changed = True
     if forbidden_topics:
-        topics = tuple(sorted(topic.strip() for topic in forbidden_topics.split(",") if topic.strip()))
+        topics = tuple(topic.strip() for topic in forbidden_topics.split(",") if topic.strip())
         policy = replace(policy, forbidden_topics=topics)
         changed = True
     if integrity:
@@ -312,23 +369,58 @@ def _apply_cli_overrides(context: ContextConfig, overrides: Mapping[str, Any]) -
     return updated
 
 
+_CONTEXT_OVERRIDE_KEYS = ("artifact_root", "registry_url", "credentials_ref", "log_level")
+
+
+def _resolve_context(
+    context: ContextConfig,
+    dd_env: Mapping[str, str],
+    overrides: Mapping[str, Any],
+) -> ContextConfig:
+    """Apply env and CLI overrides, reusing the result for identical inputs.
+
+    ``dd_env`` holds only the ``DD_*`` variables, as collected by ``load_cli_config``.
+    """
+
+    cli = tuple((key, overrides.get(key)) for key in _CONTEXT_OVERRIDE_KEYS)
+    return _resolve_context_cached(context, tuple(sorted(dd_env.items())), cli)
+
+
+@lru_cache(maxsize=32)
+def _resolve_context_cached(
+    context: ContextConfig,
+    dd_env: Tuple[Tuple[str, str], ...],
+    cli: Tuple[Tuple[str, Any], ...],
+) -> ContextConfig:
+    return _apply_cli_overrides(_apply_env_overrides(context, dict(dd_env)), dict(cli))
+
+
 def _select_context_name(
     config: CLIConfig,
     env: Mapping[str, str],
     overrides: Mapping[str, Any],
 ) -> str:
-    if overrides.get("context"):
-        return overrides["context"]
-    if env.get("DD_CONTEXT"):
-        return env["DD_CONTEXT"]
-    persisted = read_current_context(env)
-    if persisted and persisted in config.contexts:
-        return persisted
-    if config.default_context and config.default_context in config.contexts:
-        return config.default_context
-    if config.contexts:
-        return next(iter(config.contexts.keys()))
-    raise ValueError("No CLI contexts have been configured")
+    explicit = overrides.get("context") or env.get("DD_CONTEXT")
+    if explicit:
+        return explicit
+    # The state file is only read when neither a flag nor DD_CONTEXT picks the context.
+    chosen = _fallback_context_name(
+        tuple(config.contexts), config.default_context, read_current_context(env)
+    )
+    if chosen is None:
+        raise ValueError("No CLI contexts have been configured")
+    return chosen
+
+
+def _fallback_context_name(
+    names: Tuple[str, ...],
+    default_context: Optional[str],
+    persisted: Optional[str],
+) -> Optional[str]:
+    for candidate in (persisted, default_context):
+        if candidate and candidate in names:
+            return candidate
+    return names[0] if names else None
 
 
 def load_cli_config(
@@ -337,9 +429,13 @@ def load_cli_config(
     overrides: Optional[Mapping[str, Any]] = None,
 ) -> ResolvedConfig:
     env = env or os.environ
+    # One pass over the (often large) process environment; every lookup below
+    # reads from this small snapshot of the DD_* variables instead.
+    dd_env = {key: value for key, value in env.items() if key.startswith("DD_")}
     overrides = dict(overrides or {})
 
-    path = config_path or Path(env.get("DD_CLI_CONFIG", "")) or None
+    env_config = dd_env.get("DD_CLI_CONFIG")
+    path = config_path or (Path(env_config) if env_config else None)
     if path:
         path = Path(path).expanduser()
     elif DEFAULT_CONFIG_PATH.exists():
@@ -352,31 +448,38 @@ def load_cli_config(
         config = _default_cli_config(base)
         path = None
 
-    context_name = _select_context_name(config, env, overrides)
+    context_name = _select_context_name(config, dd_env, overrides)
     if context_name not in config.contexts:
         raise ValueError(f"Unknown context '{context_name}'")
-    context = config.contexts[context_name]
-    context = _apply_env_overrides(context, env)
-    context = _apply_cli_overrides(context, overrides)
+    context = _resolve_context(config.contexts[context_name], dd_env, overrides)
 
     artifact_root = context.artifact_root
     artifact_root.mkdir(parents=True, exist_ok=True)
 
     dry_run = bool(overrides.get("dry_run"))
-    log_format = (overrides.get("log_format") or env.get("DD_LOG_FORMAT") or "text").lower()
+    log_format = (overrides.get("log_format") or dd_env.get("DD_LOG_FORMAT") or "text").lower()
     if log_format not in {"text", "json"}:
         raise ValueError("log_format must be 'text' or 'json'")
-    verbose = bool(overrides.get("verbose") or env.get("DD_VERBOSE"))
+    verbose = bool(overrides.get("verbose") or dd_env.get("DD_VERBOSE"))
+    artifact_compression = (
+        overrides.get("artifact_compression") or dd_env.get("DD_ARTIFACT_COMPRESSION") or "none"
+    ).lower()
+    if artifact_compression not in ARTIFACT_COMPRESSION_CODECS:
+        raise ValueError("artifact_compression must be 'none', 'gzip', or 'zstd'")
+    profile_parallel = bool(
+        overrides.get("profile_parallel")
+        or dd_env.get("DD_PROFILE_PARALLEL", "").strip().lower() in {"1", "true", "yes"}
+    )
 
-    state_path = _state_path(env)
+    state_path = _state_path(dd_env)
 
     plugin_trust = config.plugin_trust
-    allow_unsigned_env = env.get("DD_ALLOW_UNSIGNED_PLUGINS")
+    allow_unsigned_env = dd_env.get("DD_ALLOW_UNSIGNED_PLUGINS")
     if allow_unsigned_env is not None:
         allow_unsigned = allow_unsigned_env.strip().lower() in {"1", "true", "yes"}
         plugin_trust = plugin_trust.with_updates(allow_unsigned=allow_unsigned)
 
-    signatures_env = env.get("DD_TRUSTED_PLUGIN_SIGNATURES")
+    signatures_env = dd_env.get("DD_TRUSTED_PLUGIN_SIGNATURES")
     if signatures_env:
         entries = {}
         for item in signatures_env.split(","):
@@ -392,13 +495,16 @@ def load_cli_config(
 
     return ResolvedConfig(
         context=context,
-        contexts=dict(config.contexts),
+        # Read-only view: the parsed CLIConfig is cached and shared between loads.
+        contexts=MappingProxyType(config.contexts),
         dry_run=dry_run,
         log_format=log_format,
         verbose=verbose,
         artifact_root=artifact_root,
         config_path=path,
         state_path=state_path,
-        raw_overrides=dict(overrides),
+        raw_overrides=overrides,
         plugin_trust=plugin_trust,
+        profile_parallel=profile_parallel,
+        artifact_compression=artifact_compression,
     )
@@ -2,54 +2,143 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.config
+import os
+import queue
 import sys
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Rich is only needed to draw the spinner, so it is imported on first use.
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 LOGGER_NAME = "DomainDetermine.cli"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+_listener: Optional[QueueListener] = None
+# (log path, format, verbose, stdout) of the live configuration; stdout is part
+# of the key because test runners swap it between invocations.
+_configured: Optional[Tuple[str, str, bool, object]] = None
+
+
+# Attributes every LogRecord carries; anything else on a record came from ``extra``.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "asctime",
+    "message",
+    "taskName",
+}
+
+
+class _OrjsonFormatter(logging.Formatter):
+    """JSON formatter emitting the same fields as ``JsonFormatter(LOG_FORMAT)``."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        payload: Dict[str, object] = {
+            "asctime": self.formatTime(record, self.datefmt),
+            "levelname": record.levelname,
+            "name": record.name,
+            "message": record.message,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(payload, default=str).decode("utf-8")
+
+
+def _json_formatter_factory() -> Dict[str, object]:
+    if orjson is not None:
+        return {"()": _OrjsonFormatter}
+    return {"()": "pythonjsonlogger.json.JsonFormatter", "fmt": LOG_FORMAT}
+
+
+def _build_file_formatter(log_format: str) -> logging.Formatter:
+    if log_format == "json":
+        if orjson is not None:
+            return _OrjsonFormatter()
+        from pythonjsonlogger.json import JsonFormatter
+
+        return JsonFormatter(LOG_FORMAT)
+    return logging.Formatter(LOG_FORMAT)
+
+
+# dictConfig copies nested mappings before consuming them, so the static parts
+# of the configuration are built once and shared across calls.
+_FORMATTERS: Dict[str, Dict[str, object]] = {
+    "text": {
+        "format": LOG_FORMAT,
+    },
+    "json": _json_formatter_factory(),
+}
+_CONSOLE_HANDLER: Dict[str, object] = {"class": "logging.StreamHandler"}
+
+
+def shutdown_logging() -> None:
+    """Drain queued file records and close the active file handler."""
+
+    global _configured, _listener
+    _configured = None
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    # Detach the queue handlers first: once the listener stops, nothing drains
+    # the queue, so later records would be lost and pile up in memory.
+    for logger in (logging.getLogger(LOGGER_NAME), logging.getLogger()):
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+                logger.removeHandler(handler)
+                handler.close()
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 
 def configure_logging(log_path: Path, log_format: str, verbose: bool) -> logging.Logger:
+    """Configure console logging and a queue-backed file handler.
+
+    File writes are handed to a background ``QueueListener`` so command code
+    never blocks on disk I/O; call :func:`shutdown_logging` to flush them.
+    """
+
+    global _configured, _listener
+    key = (str(log_path), log_format, verbose, sys.stdout)
+    if _listener is not None and _configured == key:
+        return logging.getLogger(LOGGER_NAME)
+    shutdown_logging()
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    handlers: dict[str, dict[str, object]] = {
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handlers: Dict[str, Dict[str, object]] = {
         "file": {
-            "class": "logging.FileHandler",
-            "filename": str(log_path),
-            "mode": "a",
-            "encoding": "utf-8",
-            "formatter": "json" if log_format == "json" else "text",
-        }
-    }
-
-    formatters = {
-        "text": {
-            "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
+            "()": QueueHandler,
+            "queue": log_queue,
         },
-        "json": {
-            "()": "pythonjsonlogger.json.JsonFormatter",
-            "fmt": "%(asctime)s %(levelname)s %(name)s %(message)s",
+        "console": {
+            **_CONSOLE_HANDLER,
+            "stream": sys.stdout,
+            "formatter": "json" if log_format == "json" else "text",
+            "level": "DEBUG" if verbose else "INFO",
         },
     }
 
-    console_handler = {
-        "class": "logging.StreamHandler",
-        "stream": sys.stdout,
-        "formatter": "json" if log_format == "json" else "text",
-        "level": "DEBUG" if verbose else "INFO",
-    }
-    handlers["console"] = console_handler
-
     logging.config.dictConfig(
         {
             "version": 1,
             "disable_existing_loggers": False,
-            "formatters": formatters,
+            "formatters": _FORMATTERS,
             "handlers": handlers,
             "loggers": {
                 LOGGER_NAME: {
@@ -64,13 +153,34 @@ def configure_logging(log_path: Path, log_format: str, verbose: bool) -> logging
             },
         }
     )
+    file_handler = logging.FileHandler(log_path, mode="a", encoding="utf-8")
+    file_handler.setFormatter(_build_file_formatter(log_format))
+    _listener = QueueListener(log_queue, file_handler)
+    _listener.start()
+    _configured = key
+
     logger = logging.getLogger(LOGGER_NAME)
     logger.debug("Logging configured", extra={"log_path": str(log_path), "log_format": log_format})
     return logger
 
 
+atexit.register(shutdown_logging)
+
+
 @contextmanager
-def progress_spinner(message: str) -> Iterator[Progress]:
+def progress_spinner(message: str) -> Iterator[Optional[Progress]]:
+    """Show a transient spinner on stderr; yields ``None`` when spinners are off.
+
+    Spinners are skipped when stderr is not a terminal or ``DD_NO_SPINNER`` is set.
+    """
+
+    if os.environ.get("DD_NO_SPINNER") or not sys.stderr.isatty():
+        yield None
+        return
+
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     console = Console(stderr=True)
     progress = Progress(
         SpinnerColumn(),
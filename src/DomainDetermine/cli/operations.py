@@ -5,25 +5,54 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
-import click
 import typer
 
 from .config import ResolvedConfig
 from .logging import progress_spinner
+from .serialization import atomic_write_bytes, dumps_pretty, loads_json
 
 JsonDict = Dict[str, Any]
 
 
-@dataclass(frozen=True)
+# json.dumps builds a new encoder whenever options are passed; one shared encoder
+# produces identical text without that per-call setup.
+_FINGERPRINT_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+
+def _sha256_fingerprint(payload: Mapping[str, Any]) -> str:
+    serialised = _FINGERPRINT_ENCODER.encode(payload)
+    return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+
+def _blake2b_fingerprint(payload: Mapping[str, Any]) -> str:
+    serialised = _FINGERPRINT_ENCODER.encode(payload)
+    return hashlib.blake2b(serialised.encode("utf-8"), digest_size=32).hexdigest()
+
+
+# Fingerprints only detect changed inputs, so a fast non-SHA-2 hash is sufficient.
+# Older algorithms stay registered so existing manifest entries remain comparable.
+FINGERPRINT_ALGORITHM = "blake2b-256"
+_FINGERPRINTERS: Dict[str, Callable[[Mapping[str, Any]], str]] = {
+    "sha256": _sha256_fingerprint,
+    "blake2b-256": _blake2b_fingerprint,
+}
+
+# Serialises manifest read-modify-write cycles when profile steps run concurrently.
+_MANIFEST_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
 class CommandRuntime:
     """Holds context required during command execution."""
 
     config: ResolvedConfig
     logger: logging.Logger
+    show_progress: bool = True
 
     @property
     def dry_run(self) -> bool:
@@ -49,31 +78,87 @@ class OperationExecutor:
         self._runtime = runtime
         self._state_dir = runtime.artifact_root / ".cli_state"
         self._state_dir.mkdir(parents=True, exist_ok=True)
+        # verb -> ((st_ino, st_mtime_ns, st_size), parsed manifest).
+        self._manifests: Dict[str, Tuple[Tuple[int, int, int], JsonDict]] = {}
 
     def _manifest_path(self, verb: str) -> Path:
         return self._state_dir / f"{verb}.json"
 
     def _load_manifest(self, verb: str) -> JsonDict:
         path = self._manifest_path(verb)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return {}
+        # Manifests are replaced atomically, so a rewrite always yields a new inode;
+        # an unchanged key means the parsed copy from the previous load is current.
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._manifests.get(verb)
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            manifest = loads_json(path.read_bytes())
         except json.JSONDecodeError:
             self._runtime.logger.warning(
                 "Manifest corrupted; resetting",
                 extra={"verb": verb, "path": str(path)},
             )
             return {}
+        self._manifests[verb] = (key, manifest)
+        return dict(manifest)
 
     def _persist_manifest(self, verb: str, manifest: JsonDict) -> None:
         path = self._manifest_path(verb)
-        path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        # The manifest is the idempotency record, so it is replaced atomically and
+        # synced; a crash leaves the previous manifest rather than a torn one.
+        atomic_write_bytes(path, dumps_pretty(manifest, default=str), fsync=True)
 
     @staticmethod
     def _fingerprint(payload: Mapping[str, Any]) -> str:
-        serialised = json.dumps(payload, sort_keys=True, default=str)
-        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+        return _FINGERPRINTERS[FINGERPRINT_ALGORITHM](payload)
+
+    def _is_current(
+        self,
+        verb: str,
+        subject: str,
+        payload: Mapping[str, Any],
+        fingerprint: str,
+    ) -> bool:
+        entry = self._load_manifest(verb).get(subject)
+        if not entry:
+            return False
+        # Entries recorded before the algorithm was tracked carry SHA-256 digests;
+        # comparing with their own algorithm keeps them valid without a re-run.
+        algorithm = entry.get("fingerprint_algorithm", "sha256")
+        if algorithm != FINGERPRINT_ALGORITHM:
+            legacy = _FINGERPRINTERS.get(algorithm)
+            fingerprint = legacy(payload) if legacy is not None else fingerprint
+        if entry.get("fingerprint") == fingerprint:
+            self._runtime.logger.info(
+                "Operation skipped; fingerprint unchanged",
+                extra={"verb": verb, "subject": subject, "fingerprint": fingerprint},
+            )
+            typer.echo(f"[no-op] {verb} {subject} is already up to date")
+            return True
+        return False
+
+    def preview(
+        self,
+        verb: str,
+        subject: str,
+        payload: Mapping[str, Any],
+        preview_message: str,
+    ) -> str:
+        """Report what ``run`` would do in dry-run mode without needing a performer."""
+
+        if self._is_current(verb, subject, payload, self._fingerprint(payload)):
+            return OperationOutcome.NOOP
+        self._runtime.logger.info(
+            "Dry-run preview",
+            extra={"verb": verb, "subject": subject, "payload": dict(payload)},
+        )
+        typer.echo(f"[dry-run] {preview_message}")
+        return OperationOutcome.DRY_RUN
 
     def run(
         self,
@@ -85,39 +170,30 @@ class OperationExecutor:
     ) -> str:
         """Run an operation with idempotency and progress reporting."""
 
-        manifest = self._load_manifest(verb)
-        entry = manifest.get(subject)
-        fingerprint = self._fingerprint(payload)
+        if self._runtime.dry_run:
+            return self.preview(verb, subject, payload, preview_message)
 
-        if entry and entry.get("fingerprint") == fingerprint:
-            self._runtime.logger.info(
-                "Operation skipped; fingerprint unchanged",
-                extra={"verb": verb, "subject": subject, "fingerprint": fingerprint},
-            )
-            click.echo(f"[no-op] {verb} {subject} is already up to date")
+        fingerprint = self._fingerprint(payload)
+        if self._is_current(verb, subject, payload, fingerprint):
             return OperationOutcome.NOOP
 
-        if self._runtime.dry_run:
-            self._runtime.logger.info(
-                "Dry-run preview",
-                extra={"verb": verb, "subject": subject, "payload": dict(payload)},
-            )
-            click.echo(f"[dry-run] {preview_message}")
-            return OperationOutcome.DRY_RUN
-
         artifact_path: Optional[Path]
-        if self._runtime.config.log_format == "json":
+        if self._runtime.config.log_format == "json" or not self._runtime.show_progress:
             artifact_path = performer()
         else:
             with progress_spinner(f"{verb.capitalize()} {subject}"):
                 artifact_path = performer()
 
-        manifest[subject] = {
-            "fingerprint": fingerprint,
-            "payload": dict(payload),
-            "artifact": str(artifact_path) if artifact_path else None,
-        }
-        self._persist_manifest(verb, manifest)
+        with _MANIFEST_LOCK:
+            # Reload so concurrent steps sharing a verb do not drop each other's entries.
+            manifest = self._load_manifest(verb)
+            manifest[subject] = {
+                "fingerprint": fingerprint,
+                "fingerprint_algorithm": FINGERPRINT_ALGORITHM,
+                "payload": dict(payload),
+                "artifact": str(artifact_path) if artifact_path else None,
+            }
+            self._persist_manifest(verb, manifest)
 
         self._runtime.logger.info(
             "Operation executed",
@@ -128,15 +204,23 @@ class OperationExecutor:
                 "fingerprint": fingerprint,
             },
         )
-        click.echo(f"[ok] {verb} {subject}")
+        typer.echo(f"[ok] {verb} {subject}")
         if artifact_path:
-            click.echo(f"       artifact: {artifact_path}")
+            typer.echo(f"       artifact: {artifact_path}")
         return OperationOutcome.EXECUTED
 
 
 def build_runtime(ctx: typer.Context) -> CommandRuntime:
-    """Construct a runtime from the Typer context."""
-
-    resolved: ResolvedConfig = ctx.obj["config"]
-    logger: logging.Logger = ctx.obj["logger"]
-    return CommandRuntime(config=resolved, logger=logger)
+    """Return the runtime for this invocation, constructing it on first use.
+
+    The runtime is cached in ``ctx.obj`` so profile steps and nested commands
+    reuse the instance built by the first caller.
+    """
+
+    runtime: Optional[CommandRuntime] = ctx.obj.get("runtime")
+    if runtime is None:
+        resolved: ResolvedConfig = ctx.obj["config"]
+        logger: logging.Logger = ctx.obj["logger"]
+        runtime = CommandRuntime(config=resolved, logger=logger)
+        ctx.obj["runtime"] = runtime
+    return runtime
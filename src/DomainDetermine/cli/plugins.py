@@ -7,12 +7,15 @@ import copy
 import hashlib
 import hmac
 import importlib.metadata as metadata
-import inspect
 import io
 import logging
 import os
+import sys
 import tempfile
-from dataclasses import dataclass
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple, runtime_checkable
 
@@ -44,27 +47,140 @@ class Plugin(Protocol):
 
 @dataclass
 class PluginWrapper:
-    """Adapter around plugin callables to expose metadata consistently."""
+    """Adapter around plugin callables to expose metadata consistently.
+
+    Plugins receive the caller's payload as keyword arguments; one that
+    mutates nested values in place should set ``mutates_payload = True`` so it
+    is handed a deep copy instead. Plugins find their scratch directory via
+    ``sandbox_directory()``; one that launches subprocesses should set
+    ``needs_subprocess = True`` to have ``DD_PLUGIN_SANDBOX_DIR`` exported too.
+    ``module``, ``origin``, and ``digest`` are resolved from ``source`` on first
+    access, so plugin files are only stat'ed and hashed when a trust check
+    needs them.
+    """
 
     name: str
     version: str
     category: str
     description: str
     callable: Callable[[CommandRuntime, Dict[str, Any]], Any]
-    module: Optional[str]
-    origin: Optional[Path]
-    digest: Optional[str]
     entry_point: Optional[str]
+    source: Any = field(default=None, repr=False, compare=False)
+    mutates_payload: bool = False
+    needs_subprocess: bool = False
+
+    @cached_property
+    def _location(self) -> Tuple[Optional[str], Optional[Path]]:
+        return _resolve_origin(self.source)
+
+    @property
+    def module(self) -> Optional[str]:
+        return self._location[0]
+
+    @property
+    def origin(self) -> Optional[Path]:
+        return self._location[1]
+
+    @cached_property
+    def digest(self) -> Optional[str]:
+        digest = self.digest_bytes
+        return digest.hex() if digest is not None else None
+
+    @cached_property
+    def digest_bytes(self) -> Optional[bytes]:
+        return _compute_digest(self.origin)
 
     def execute(self, runtime: CommandRuntime, payload: Dict[str, Any]) -> Any:
         return self.callable(runtime, payload)
 
 
+class LazyPluginWrapper(PluginWrapper):
+    """Entry-point plugin that defers importing its module until first use.
+
+    Name, version, and module come from entry-point metadata (the entry-point
+    name and the distribution version), so listing plugins never imports them;
+    the callable, origin, and digest are resolved on the first ``execute`` or
+    signature check. A failed import is remembered in ``load_error``.
+    """
+
+    def __init__(self, category: str, entry_point: metadata.EntryPoint) -> None:
+        dist = entry_point.dist
+        self.name = entry_point.name
+        self.version = dist.version if dist is not None else "0.0.0"
+        self.category = category
+        self.entry_point = entry_point.name
+        self._source = entry_point
+
+    @cached_property
+    def _loaded(self) -> Tuple[Optional[PluginWrapper], Optional[str]]:
+        try:
+            return _wrap_plugin(self.category, self._source.load(), self.name), None
+        except Exception as exc:
+            return None, str(exc)
+
+    @property
+    def _target(self) -> PluginWrapper:
+        target, error = self._loaded
+        if target is None:
+            raise PluginExecutionError(f"Failed to load plugin '{self.name}': {error}")
+        return target
+
+    @property
+    def load_error(self) -> Optional[str]:
+        """Return why importing the plugin failed, importing it if needed."""
+
+        return self._loaded[1]
+
+    @property
+    def description(self) -> str:  # type: ignore[override]
+        return self._target.description
+
+    @property
+    def callable(self) -> Callable[[CommandRuntime, Dict[str, Any]], Any]:  # type: ignore[override]
+        return self._target.callable
+
+    @property
+    def module(self) -> Optional[str]:  # type: ignore[override]
+        return self._source.module
+
+    @property
+    def origin(self) -> Optional[Path]:  # type: ignore[override]
+        return self._target.origin
+
+    @property
+    def digest(self) -> Optional[str]:  # type: ignore[override]
+        return self._target.digest
+
+    @property
+    def digest_bytes(self) -> Optional[bytes]:  # type: ignore[override]
+        return self._target.digest_bytes
+
+    @property
+    def mutates_payload(self) -> bool:  # type: ignore[override]
+        return self._target.mutates_payload
+
+    @property
+    def needs_subprocess(self) -> bool:  # type: ignore[override]
+        return self._target.needs_subprocess
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyPluginWrapper(name={self.name!r}, category={self.category!r}, "
+            f"entry_point={self._source.value!r})"
+        )
+
+
 class PluginRegistry:
     """Registry responsible for discovering and executing CLI plugins."""
 
     def __init__(self) -> None:
         self._manual: Dict[str, Dict[str, PluginWrapper]] = {}
+        # Entry-point scans are expensive; cache each category's resolved
+        # wrappers, tagged with the manual-registration revision they saw.
+        self._ep_cache: Dict[str, Tuple[int, Dict[str, PluginWrapper]]] = {}
+        self._manual_rev = 0
+        # Installed entry points for every plugin group, from a single scan.
+        self._group_entry_points: Optional[Dict[str, Tuple[metadata.EntryPoint, ...]]] = None
 
     @property
     def categories(self) -> Iterable[str]:  # pragma: no cover - simple access
@@ -73,9 +189,11 @@ class PluginRegistry:
     def register(self, category: str, plugin: Plugin | Callable[..., Any]) -> None:
         wrapper = _wrap_plugin(category, plugin)
         self._manual.setdefault(category, {})[wrapper.name] = wrapper
+        self._manual_rev += 1
 
     def unregister(self, category: str, name: str) -> None:
         self._manual.get(category, {}).pop(name, None)
+        self._manual_rev += 1
 
     def list_plugins(
         self,
@@ -83,33 +201,81 @@ class PluginRegistry:
         logger: logging.Logger,
         trust_policy: Optional[PluginTrustPolicy] = None,
     ) -> List[PluginWrapper]:
-        wrappers: Dict[str, PluginWrapper] = dict(self._manual.get(category, {}))
-        entry_point_group = PLUGIN_ENTRY_POINTS.get(category)
-        if entry_point_group:
-            for entry_point in metadata.entry_points(group=entry_point_group):
-                if entry_point.name in wrappers:
-                    continue
-                try:
-                    loaded = entry_point.load()
-                    wrapper = _wrap_plugin(category, loaded, entry_point.name)
-                    wrappers[wrapper.name] = wrapper
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.error(
-                        "Failed to load plugin",
-                        extra={
-                            "category": category,
-                            "entry_point": entry_point.name,
-                            "error": str(exc),
-                        },
-                    )
-        plugins = sorted(wrappers.values(), key=lambda wrapper: wrapper.name)
-        if trust_policy and not trust_policy.allow_unsigned:
-            for plugin in plugins:
-                if _plugin_trust_status(plugin, trust_policy) == "untrusted":
-                    logger.warning(
-                        "Plugin missing trusted signature",
-                        extra={"category": category, "plugin": plugin.name},
-                    )
+        return self._checked(category, self._wrappers(category), logger, trust_policy)
+
+    def list_all(
+        self,
+        logger: logging.Logger,
+        trust_policy: Optional[PluginTrustPolicy] = None,
+        categories: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[PluginWrapper]]:
+        """Return plugins for each category, scanning installed entry points once."""
+
+        selected = self.categories if categories is None else categories
+        return {
+            category: self._checked(category, self._wrappers(category), logger, trust_policy)
+            for category in selected
+        }
+
+    def _wrappers(self, category: str) -> Dict[str, PluginWrapper]:
+        cached = self._ep_cache.get(category)
+        if cached is not None and cached[0] == self._manual_rev:
+            return cached[1]
+        return self._collect(category, self._entry_points(PLUGIN_ENTRY_POINTS.get(category)))
+
+    def _entry_points(self, group: Optional[str]) -> Tuple[metadata.EntryPoint, ...]:
+        if group is None:
+            return ()
+        if self._group_entry_points is None:
+            # One scan serves every category; manual registrations never change
+            # what is installed, so only ``invalidate()`` forces a rescan.
+            discovered = metadata.entry_points()
+            self._group_entry_points = {
+                name: tuple(discovered.select(group=name)) for name in PLUGIN_ENTRY_POINTS.values()
+            }
+        return self._group_entry_points.get(group, ())
+
+    def _collect(
+        self,
+        category: str,
+        entry_points: Iterable[metadata.EntryPoint],
+    ) -> Dict[str, PluginWrapper]:
+        found: Dict[str, PluginWrapper] = dict(self._manual.get(category, {}))
+        for entry_point in entry_points:
+            if entry_point.name in found:
+                continue
+            found[entry_point.name] = LazyPluginWrapper(category, entry_point)
+        # Sort once here so every cached listing is already in display order.
+        wrappers = {name: found[name] for name in sorted(found)}
+        self._ep_cache[category] = (self._manual_rev, wrappers)
+        return wrappers
+
+    def _checked(
+        self,
+        category: str,
+        wrappers: Dict[str, PluginWrapper],
+        logger: logging.Logger,
+        trust_policy: Optional[PluginTrustPolicy],
+    ) -> List[PluginWrapper]:
+        plugins = list(wrappers.values())
+        if trust_policy is None:
+            return plugins
+        for plugin in plugins:
+            status = _plugin_trust_status(plugin, trust_policy)
+            if status == "untrusted":
+                logger.warning(
+                    "Plugin missing trusted signature",
+                    extra={"category": category, "plugin": plugin.name},
+                )
+            elif status == "load-error":
+                logger.error(
+                    "Failed to load plugin",
+                    extra={
+                        "category": category,
+                        "entry_point": plugin.entry_point,
+                        "error": getattr(plugin, "load_error", None),
+                    },
+                )
         return plugins
 
     def execute(
@@ -122,10 +288,7 @@ class PluginRegistry:
     ) -> Any:
         plugin = self._manual.get(category, {}).get(name)
         if plugin is None:
-            for wrapper in self.list_plugins(category, logger, runtime.config.plugin_trust):
-                if wrapper.name == name:
-                    plugin = wrapper
-                    break
+            plugin = self._wrappers(category).get(name)
         if plugin is None:
             raise PluginExecutionError(f"Plugin '{name}' not found in category '{category}'")
         _verify_plugin_signature(plugin, runtime.config.plugin_trust, logger)
@@ -135,7 +298,7 @@ class PluginRegistry:
                 extra={"category": category, "plugin": name, "payload": payload},
             )
             with _plugin_sandbox(plugin, logger):
-                sandbox_payload = copy.deepcopy(payload)
+                sandbox_payload = copy.deepcopy(payload) if plugin.mutates_payload else payload
                 return plugin.execute(runtime, sandbox_payload)
         except Exception as exc:
             logger.error(
@@ -146,6 +309,13 @@ class PluginRegistry:
 
     def clear_manual(self) -> None:
         self._manual.clear()
+        self._manual_rev += 1
+
+    def invalidate(self) -> None:
+        """Drop cached entry-point discovery so the next lookup rescans."""
+
+        self._ep_cache.clear()
+        self._group_entry_points = None
 
 
 def _wrap_plugin(
@@ -153,8 +323,8 @@ def _wrap_plugin(
     candidate: Plugin | Callable[..., Any],
     entry_point_name: Optional[str] = None,
 ) -> PluginWrapper:
-    module_name, origin = _resolve_origin(candidate)
-    digest = _compute_digest(origin)
+    mutates_payload = bool(getattr(candidate, "mutates_payload", False))
+    needs_subprocess = bool(getattr(candidate, "needs_subprocess", False))
 
     if isinstance(candidate, Plugin):
         callable_fn = candidate.execute
@@ -167,10 +337,10 @@ def _wrap_plugin(
             category=category,
             description=description,
             callable=lambda runtime, payload: callable_fn(runtime=runtime, **payload),
-            module=module_name,
-            origin=origin,
-            digest=digest,
             entry_point=entry_point_name,
+            source=candidate,
+            mutates_payload=mutates_payload,
+            needs_subprocess=needs_subprocess,
         )
 
     if callable(candidate):
@@ -187,10 +357,10 @@ def _wrap_plugin(
             category=category,
             description=description,
             callable=wrapper,
-            module=module_name,
-            origin=origin,
-            digest=digest,
             entry_point=entry_point_name,
+            source=candidate,
+            mutates_payload=mutates_payload,
+            needs_subprocess=needs_subprocess,
         )
 
     raise PluginExecutionError(
@@ -202,21 +372,34 @@ registry = PluginRegistry()
 
 
 def _resolve_origin(candidate: Plugin | Callable[..., Any]) -> Tuple[Optional[str], Optional[Path]]:
-    obj = candidate
-    if isinstance(candidate, Plugin):  # type: ignore[misc]
-        obj = candidate  # pragma: no cover - structural fallback
-    module = inspect.getmodule(obj)
-    module_name = module.__name__ if module else None
-    origin = getattr(module, "__file__", None) if module else None
-    return module_name, Path(origin).resolve() if origin else None
+    # Functions and plugin instances both expose ``__module__`` (instances via
+    # their class), so a direct ``sys.modules`` lookup is enough.
+    module_name = getattr(candidate, "__module__", None)
+    module = sys.modules.get(module_name) if module_name else None
+    origin = getattr(module, "__file__", None)
+    return module_name, Path(origin) if origin else None
+
 
+# Keyed on inode as well as mtime/size so a plugin file swapped in by rename
+# (as package installers do) is always rehashed.
+_DIGEST_CACHE: Dict[Tuple[Path, int, int, int], bytes] = {}
 
-def _compute_digest(origin: Optional[Path]) -> Optional[str]:
-    if origin is None or not origin.exists() or not origin.is_file():
+
+def _compute_digest(origin: Optional[Path]) -> Optional[bytes]:
+    """Return the raw SHA-256 digest of ``origin``; hex is derived only for display."""
+
+    if origin is None:
         return None
     try:
-        return hashlib.sha256(origin.read_bytes()).hexdigest()
-    except OSError:  # pragma: no cover - defensive
+        with origin.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            key = (origin, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            digest = _DIGEST_CACHE.get(key)
+            if digest is None:
+                digest = hashlib.file_digest(handle, "sha256").digest()
+                _DIGEST_CACHE[key] = digest
+            return digest
+    except OSError:
         return None
 
 
@@ -226,17 +409,15 @@ def _plugin_trust_status(
 ) -> str:
     if policy is None:
         return "unknown"
-    if policy.allow_unsigned:
-        if wrapper.name in policy.signature_allowlist and wrapper.digest:
-            expected = policy.signature_allowlist[wrapper.name]
-            return "trusted" if hmac.compare_digest(wrapper.digest, expected) else "signature-mismatch"
-        return "unsigned"
-    expected = policy.signature_allowlist.get(wrapper.name)
-    if expected is None:
-        return "untrusted"
-    if wrapper.digest is None:
+    if wrapper.name not in policy.trusted_names:
+        return "unsigned" if policy.allow_unsigned else "untrusted"
+    if getattr(wrapper, "load_error", None) is not None:
+        return "load-error"
+    digest = wrapper.digest_bytes
+    if digest is None:
         return "unsigned"
-    return "trusted" if hmac.compare_digest(wrapper.digest, expected) else "signature-mismatch"
+    expected = policy.normalized_allowlist[wrapper.name]
+    return "trusted" if hmac.compare_digest(digest, expected) else "signature-mismatch"
 
 
 def _verify_plugin_signature(
@@ -247,6 +428,8 @@ def _verify_plugin_signature(
     status = _plugin_trust_status(wrapper, policy)
     if status in {"unknown", "unsigned", "trusted"}:
         return
+    if status == "load-error":
+        raise PluginExecutionError(f"Failed to load plugin '{wrapper.name}': {wrapper.load_error}")
     if status == "signature-mismatch":
         logger.error(
             "Plugin signature mismatch",
@@ -280,34 +463,144 @@ def describe_plugin_trust(
         return "untrusted"
     if status == "unsigned":
         return "unsigned"
+    if status == "load-error":
+        return "load-error"
     return "unknown"
 
 
+_SANDBOX_DIR: ContextVar[Optional[Path]] = ContextVar("dd_plugin_sandbox_dir", default=None)
+_SANDBOX_ENV_KEYS = ("DD_PLUGIN_SANDBOX", "DD_PLUGIN_SANDBOX_DIR")
+
+
+def sandbox_directory() -> Optional[Path]:
+    """Return the scratch directory of the plugin currently executing, if any."""
+
+    return _SANDBOX_DIR.get()
+
+
+@contextlib.contextmanager
+def _sandbox_environ(sandbox_dir: str):
+    previous = {key: os.environ.get(key) for key in _SANDBOX_ENV_KEYS}
+    os.environ["DD_PLUGIN_SANDBOX"] = "1"
+    os.environ["DD_PLUGIN_SANDBOX_DIR"] = sandbox_dir
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+_BUFFER_POOL = threading.local()
+
+
+@contextlib.contextmanager
+def _capture_buffers():
+    """Lend a cleared stdout/stderr ``StringIO`` pair from this thread's pool.
+
+    Nested plugin runs take a second pair, so the pool never hands out a
+    buffer that is still in use.
+    """
+
+    pool: List[Tuple[io.StringIO, io.StringIO]] = _BUFFER_POOL.__dict__.setdefault("free", [])
+    buffers = pool.pop() if pool else (io.StringIO(), io.StringIO())
+    try:
+        yield buffers
+    finally:
+        for buffer in buffers:
+            buffer.seek(0)
+            buffer.truncate()
+        pool.append(buffers)
+
+
+def _captured_text(buffer: io.StringIO) -> str:
+    return buffer.getvalue().strip() if buffer.tell() else ""
+
+
+# Capture buffers of the plugin running in the current thread/context, if any.
+_CAPTURE_TARGETS: ContextVar[Optional[Tuple[io.StringIO, io.StringIO]]] = ContextVar(
+    "dd_plugin_capture_targets", default=None
+)
+_ROUTING_LOCK = threading.Lock()
+_ROUTING_STATE: Dict[str, Any] = {"active": 0, "streams": None}
+
+
+class _RoutedStream:
+    """Stand-in for ``sys.stdout``/``sys.stderr`` while plugins are sandboxed.
+
+    Writes from a context with a running plugin land in that plugin's capture
+    buffer; every other thread keeps writing to the real stream. Unlike
+    ``contextlib.redirect_stdout`` this is safe when profile steps run plugins
+    concurrently on a thread pool.
+    """
+
+    def __init__(self, stream: Any, index: int) -> None:
+        self._stream = stream
+        self._index = index
+
+    def _target(self) -> Any:
+        targets = _CAPTURE_TARGETS.get()
+        return self._stream if targets is None else targets[self._index]
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+@contextlib.contextmanager
+def _routed_std_streams():
+    """Install the routed streams while at least one plugin sandbox is open."""
+
+    with _ROUTING_LOCK:
+        if _ROUTING_STATE["active"] == 0:
+            streams = (sys.stdout, sys.stderr)
+            _ROUTING_STATE["streams"] = streams
+            sys.stdout = _RoutedStream(streams[0], 0)
+            sys.stderr = _RoutedStream(streams[1], 1)
+        _ROUTING_STATE["active"] += 1
+    try:
+        yield
+    finally:
+        with _ROUTING_LOCK:
+            _ROUTING_STATE["active"] -= 1
+            if _ROUTING_STATE["active"] == 0:
+                stdout, stderr = _ROUTING_STATE["streams"]
+                _ROUTING_STATE["streams"] = None
+                # Leave streams alone if someone else replaced them meanwhile.
+                if isinstance(sys.stdout, _RoutedStream):
+                    sys.stdout = stdout
+                if isinstance(sys.stderr, _RoutedStream):
+                    sys.stderr = stderr
+
+
 @contextlib.contextmanager
 def _plugin_sandbox(plugin: PluginWrapper, logger: logging.Logger):
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-    previous_flag = os.environ.get("DD_PLUGIN_SANDBOX")
-    previous_dir = os.environ.get("DD_PLUGIN_SANDBOX_DIR")
-    with tempfile.TemporaryDirectory(prefix=f"dd-plugin-{plugin.name}-") as sandbox_dir:
-        os.environ["DD_PLUGIN_SANDBOX"] = "1"
-        os.environ["DD_PLUGIN_SANDBOX_DIR"] = sandbox_dir
+    with (
+        _capture_buffers() as (stdout_buffer, stderr_buffer),
+        tempfile.TemporaryDirectory(prefix=f"dd-plugin-{plugin.name}-") as sandbox_dir,
+    ):
+        token = _SANDBOX_DIR.set(Path(sandbox_dir))
+        # Only plugins that spawn subprocesses need the directory in the
+        # process environment; in-process code reads the context variable.
+        environ = (
+            _sandbox_environ(sandbox_dir) if plugin.needs_subprocess else contextlib.nullcontext()
+        )
+        capture_token = _CAPTURE_TARGETS.set((stdout_buffer, stderr_buffer))
         try:
-            with contextlib.redirect_stdout(stdout_buffer), contextlib.redirect_stderr(
-                stderr_buffer
-            ):
+            with environ, _routed_std_streams():
                 yield Path(sandbox_dir)
         finally:
-            if previous_flag is None:
-                os.environ.pop("DD_PLUGIN_SANDBOX", None)
-            else:
-                os.environ["DD_PLUGIN_SANDBOX"] = previous_flag
-            if previous_dir is None:
-                os.environ.pop("DD_PLUGIN_SANDBOX_DIR", None)
-            else:
-                os.environ["DD_PLUGIN_SANDBOX_DIR"] = previous_dir
-            stdout_value = stdout_buffer.getvalue().strip()
-            stderr_value = stderr_buffer.getvalue().strip()
+            _CAPTURE_TARGETS.reset(capture_token)
+            _SANDBOX_DIR.reset(token)
+            stdout_value = _captured_text(stdout_buffer)
+            stderr_value = _captured_text(stderr_buffer)
             if stdout_value:
                 logger.debug(
                     "Plugin stdout captured",
@@ -321,9 +614,11 @@ def _plugin_sandbox(plugin: PluginWrapper, logger: logging.Logger):
 
 
 __all__ = [
+    "LazyPluginWrapper",
     "PluginExecutionError",
     "PluginRegistry",
     "PluginWrapper",
     "describe_plugin_trust",
     "registry",
+    "sandbox_directory",
 ]
@@ -3,25 +3,29 @@
 from __future__ import annotations
 
 import inspect
-import json
+import sys
 import tomllib
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from typer.models import ArgumentInfo, OptionInfo
 
 from .config import ResolvedConfig
+from .serialization import loads_json
 
 CLI_VERSION_FALLBACK = "0.1.0"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileStep:
     """Represents a single command invocation within a profile."""
 
     verb: str
     arguments: Dict[str, Any]
+    identifier: Optional[str] = None
+    depends_on: Tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -38,18 +42,28 @@ class ProfileManifest:
             args = ", ".join(f"{key}={value}" for key, value in step.arguments.items())
             yield f"{index}. {step.verb} {args}" if args else f"{index}. {step.verb}"
 
+    def step_keys(self) -> List[str]:
+        """Return the keys ``depends_on`` entries may reference, one per step."""
+
+        return [step.identifier or str(index) for index, step in enumerate(self.steps, start=1)]
+
+
+PATH_ARGUMENT_KEYS: frozenset[str] = frozenset(
+    {
+        "source",
+        "plan_spec",
+        "report",
+        "mapping_file",
+        "ontology",
+        "dossier",
+        "config",
+        "workflow",
+        "manifest",
+    }
+)
 
-PATH_ARGUMENT_KEYS = {
-    "source",
-    "plan_spec",
-    "report",
-    "mapping_file",
-    "ontology",
-    "dossier",
-    "config",
-    "workflow",
-    "manifest",
-}
+
+STEP_RESERVED_KEYS: frozenset[str] = frozenset({"verb", "id", "depends_on"})
 
 
 def resolve_profile_path(config: ResolvedConfig, identifier: str) -> Path:
@@ -69,13 +83,25 @@ def resolve_profile_path(config: ResolvedConfig, identifier: str) -> Path:
 
 
 def load_profile(path: Path) -> ProfileManifest:
-    if not path.exists():
-        raise FileNotFoundError(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(path) from None
+    return _load_profile_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+# Keyed on modification time and size so an edited manifest is re-parsed.
+# ProfileManifest is frozen and its steps are a tuple, so sharing is safe.
+@lru_cache(maxsize=128)
+def _load_profile_cached(path_str: str, mtime_ns: int, size: int) -> ProfileManifest:
+    path = Path(path_str)
     data: Dict[str, Any]
-    if path.suffix.lower() == ".json":
-        data = json.loads(path.read_text(encoding="utf-8"))
-    else:
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    # Both parsers read the binary handle directly, skipping a decoded copy.
+    with path.open("rb") as handle:
+        if path_str[-5:].lower() == ".json":
+            data = loads_json(handle.read())
+        else:
+            data = tomllib.load(handle)
 
     name = data.get("name") or path.stem
     cli_version = data.get("cli_version") or data.get("version") or CLI_VERSION_FALLBACK
@@ -88,9 +114,22 @@ def load_profile(path: Path) -> ProfileManifest:
     for raw in raw_steps:
         if "verb" not in raw:
             raise ValueError("Profile step missing 'verb'")
-        verb = raw["verb"]
-        arguments = {k: v for k, v in raw.items() if k != "verb"}
-        steps.append(ProfileStep(verb=verb, arguments=arguments))
+        verb = sys.intern(raw["verb"])
+        identifier = raw.get("id")
+        depends_on = raw.get("depends_on") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        # Interned keys are shared across steps and compare by identity
+        # against the literal names in PATH_ARGUMENT_KEYS.
+        arguments = {sys.intern(k): v for k, v in raw.items() if k not in STEP_RESERVED_KEYS}
+        steps.append(
+            ProfileStep(
+                verb=verb,
+                arguments=arguments,
+                identifier=str(identifier) if identifier is not None else None,
+                depends_on=tuple(str(dep) for dep in depends_on),
+            )
+        )
 
     return ProfileManifest(name=name, cli_version=cli_version, steps=tuple(steps), description=description)
 
@@ -102,57 +141,108 @@ def ensure_version_compat(manifest: ProfileManifest, cli_version: str) -> None:
         )
 
 
+_KEYWORD_KINDS = frozenset(
+    {inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY}
+)
+
+
+@lru_cache(maxsize=256)
+def _command_arg_spec(handler: Callable[..., Any]) -> Tuple[frozenset[str], frozenset[str]]:
+    """Return ``(required, all)`` parameter names for a command handler.
+
+    Profiles usually repeat a handful of verbs, so the signature walk is done
+    once per handler rather than once per step.
+    """
+
+    parameters = inspect.signature(handler).parameters
+    required: List[str] = []
+    for name, parameter in parameters.items():
+        if name == "ctx" or parameter.kind not in _KEYWORD_KINDS:
+            continue
+        default = parameter.default
+        if default is inspect.Signature.empty or (
+            isinstance(default, (ArgumentInfo, OptionInfo)) and default.default is ...
+        ):
+            required.append(name)
+    return frozenset(required), frozenset(parameters)
+
+
 def validate_profile(
     manifest: ProfileManifest, resolver: Callable[[str], Callable[..., Any]]
 ) -> List[str]:
     """Validate that profile steps match available commands and required arguments."""
 
     errors: List[str] = []
-    for index, step in enumerate(manifest.steps, start=1):
+    known_keys = set(manifest.step_keys())
+    # Profiles often repeat verbs; resolve each distinct verb only once.
+    handlers: Dict[str, Callable[..., Any] | ValueError] = {}
+    for verb in dict.fromkeys(step.verb for step in manifest.steps):
         try:
-            handler = resolver(step.verb)
+            handlers[verb] = resolver(verb)
         except ValueError as exc:
-            errors.append(f"Step {index}: {exc}")
+            handlers[verb] = exc
+    dependencies_known = True
+    for index, step in enumerate(manifest.steps, start=1):
+        unknown_dependencies = [dep for dep in step.depends_on if dep not in known_keys]
+        if unknown_dependencies:
+            dependencies_known = False
+            unknown = ", ".join(sorted(unknown_dependencies))
+            errors.append(f"Step {index} ({step.verb}): unknown dependencies: {unknown}")
+        handler = handlers[step.verb]
+        if isinstance(handler, ValueError):
+            errors.append(f"Step {index}: {handler}")
             continue
 
-        signature = inspect.signature(handler)
-        required_arguments: List[str] = []
-        for name, parameter in signature.parameters.items():
-            if name == "ctx":
-                continue
-            if parameter.kind not in {
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                inspect.Parameter.KEYWORD_ONLY,
-            }:
-                continue
-            default = parameter.default
-            is_required = False
-            if default is inspect.Signature.empty:
-                is_required = True
-            elif isinstance(default, ArgumentInfo):
-                is_required = default.default is ...  # type: ignore[comparison-overlap]
-            elif isinstance(default, OptionInfo):
-                is_required = default.default is ...  # type: ignore[comparison-overlap]
-            if is_required:
-                required_arguments.append(name)
-
-        missing = [arg for arg in required_arguments if arg not in step.arguments]
+        required_arguments, parameter_names = _command_arg_spec(handler)
+        argument_names = step.arguments.keys()
+        missing = required_arguments - argument_names
         if missing:
             errors.append(
                 f"Step {index} ({step.verb}): missing required arguments: {', '.join(sorted(missing))}"
             )
 
-        unexpected = [
-            key for key in step.arguments.keys() if key not in signature.parameters
-        ]
+        unexpected = argument_names - parameter_names
         if unexpected:
             errors.append(
                 f"Step {index} ({step.verb}): unexpected arguments: {', '.join(sorted(unexpected))}"
             )
 
+    if dependencies_known:
+        try:
+            schedule_profile_steps(manifest)
+        except ValueError as exc:
+            errors.append(str(exc))
+
     return errors
 
 
+def schedule_profile_steps(manifest: ProfileManifest) -> List[List[ProfileStep]]:
+    """Group steps into waves whose members only depend on earlier waves.
+
+    Steps without ``depends_on`` are independent and land in the first wave.
+    Within a wave, steps keep their manifest order.
+    """
+
+    keys = manifest.step_keys()
+    duplicates = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicates:
+        raise ValueError(
+            f"Profile '{manifest.name}' has duplicate step ids: {', '.join(duplicates)}"
+        )
+    remaining = dict(zip(keys, manifest.steps))
+    completed: set[str] = set()
+    waves: List[List[ProfileStep]] = []
+    while remaining:
+        ready = [key for key, step in remaining.items() if completed.issuperset(step.depends_on)]
+        if not ready:
+            raise ValueError(
+                f"Profile '{manifest.name}' has circular step dependencies: {', '.join(remaining)}"
+            )
+        waves.append([remaining.pop(key) for key in ready])
+        completed.update(ready)
+    return waves
+
+
 __all__ = [
     "PATH_ARGUMENT_KEYS",
     "ProfileManifest",
@@ -160,5 +250,6 @@ __all__ = [
     "ensure_version_compat",
     "load_profile",
     "resolve_profile_path",
+    "schedule_profile_steps",
     "validate_profile",
 ]
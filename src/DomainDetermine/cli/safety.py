@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
 import os
+import re
+import stat
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
+from dataclasses import asdict
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import typer
 
@@ -17,7 +29,14 @@ class PreflightError(RuntimeError):
 
 
 class PreflightChecks:
-    """Run policy-driven preflight checks before mutating operations."""
+    """Run policy-driven preflight checks before mutating operations.
+
+    Setting ``DD_PREFLIGHT_CACHE_TTL`` to a positive number of seconds lets a
+    passing run be reused within this process for the same policy, verb,
+    payload, and accepted license flags. Integrity markers are not re-checked
+    while a cached pass is valid, so the cache is off by default; a value that
+    is not a finite number logs a warning and leaves it off.
+    """
 
     def __init__(
         self,
@@ -28,15 +47,51 @@ class PreflightChecks:
         self._policy = policy
         self._logger = logger
         self._env = environment or os.environ
+        self._topic_pattern = _compile_topics(policy.forbidden_topic_set)
+        self._min_topic_length = min(map(len, policy.forbidden_topic_set), default=0)
+        self._cache_ttl = self._read_cache_ttl()
 
     def run(self, verb: str, payload: Mapping[str, object]) -> None:
+        cache_key = self._cache_key(verb, payload) if self._cache_ttl > 0 else None
+        if cache_key is not None and _cached_pass(cache_key):
+            self._logger.debug("Reusing cached preflight pass", extra={"verb": verb})
+            return
         self._logger.debug("Running preflight checks", extra={"verb": verb})
         self._check_license_flags()
         self._check_forbidden_topics(payload)
         self._check_integrity_markers()
+        if cache_key is not None:
+            _remember_pass(cache_key, time.monotonic() + self._cache_ttl)
+
+    def _read_cache_ttl(self) -> float:
+        raw = self._env.get("DD_PREFLIGHT_CACHE_TTL") or ""
+        if not raw.strip():
+            return 0.0
+        try:
+            ttl = float(raw)
+        except ValueError:
+            ttl = math.nan
+        if not math.isfinite(ttl):
+            self._logger.warning(
+                "Ignoring invalid DD_PREFLIGHT_CACHE_TTL; preflight cache disabled",
+                extra={"value": raw},
+            )
+            return 0.0
+        return ttl
+
+    def _cache_key(self, verb: str, payload: Mapping[str, object]) -> str:
+        serialised = _CACHE_KEY_ENCODER.encode(
+            [
+                _policy_fingerprint(self._policy),
+                verb,
+                payload,
+                self._env.get("DD_ACCEPTED_LICENSE_FLAGS", ""),
+            ]
+        )
+        return hashlib.blake2b(serialised.encode("utf-8"), digest_size=32).hexdigest()
 
     def _check_license_flags(self) -> None:
-        required = set(self._policy.license_flags)
+        required = self._policy.license_flag_set
         if not required:
             return
         accepted = {
@@ -55,28 +110,48 @@ class PreflightChecks:
             )
 
     def _check_forbidden_topics(self, payload: Mapping[str, object]) -> None:
-        topics = {topic.lower() for topic in self._policy.forbidden_topics}
-        if not topics:
+        if self._topic_pattern is None:
+            return
+        # Values shorter than every topic cannot contain one; skip them before
+        # paying for the join and lower-casing.
+        minimum = self._min_topic_length
+        scanned = [value for value in _string_values(payload) if len(value) >= minimum]
+        if not scanned:
             return
-        scanned = list(_string_values(payload))
-        for topic in topics:
-            for value in scanned:
-                if topic in value.lower():
-                    self._logger.error(
-                        "Forbidden topic detected",
-                        extra={"topic": topic, "value": value},
-                    )
-                    raise PreflightError(f"Payload references forbidden topic: {topic}")
+        # One search over every lower-cased value; the separator keeps matches
+        # from spanning two values. Values may contain the separator themselves,
+        # so the offending one is located by its start offset, not by counting.
+        lowered = [value.lower() for value in scanned]
+        starts = list(accumulate((len(value) + 1 for value in lowered[:-1]), initial=0))
+        match = self._topic_pattern.search(_VALUE_SEPARATOR.join(lowered))
+        if match is None:
+            return
+        topic = match.group()
+        value = scanned[bisect_right(starts, match.start()) - 1]
+        self._logger.error(
+            "Forbidden topic detected",
+            extra={"topic": topic, "value": value},
+        )
+        raise PreflightError(f"Payload references forbidden topic: {topic}")
 
     def _check_integrity_markers(self) -> None:
-        for marker in self._policy.integrity_markers:
-            if not marker.exists():
+        markers = self._policy.integrity_markers
+        if not markers:
+            return
+        for marker in markers:
+            # One stat per marker answers existence, type, and size together;
+            # it follows symlinks, so dangling links count as missing. Any stat
+            # failure (symlink loops, permissions, overlong names) counts as
+            # missing too, as ``Path.exists()`` did.
+            try:
+                marker_stat = os.stat(marker)
+            except OSError:
                 self._logger.error(
                     "Integrity marker missing",
                     extra={"marker": str(marker)},
                 )
-                raise PreflightError(f"Integrity marker missing: {marker}")
-            if marker.is_file() and marker.stat().st_size == 0:
+                raise PreflightError(f"Integrity marker missing: {marker}") from None
+            if stat.S_ISREG(marker_stat.st_mode) and marker_stat.st_size == 0:
                 self._logger.error(
                     "Integrity marker empty",
                     extra={"marker": str(marker)},
@@ -123,32 +198,139 @@ def require_confirmation(assume_yes: bool, prompt: str) -> None:
         raise typer.Abort()
 
 
+# ``env:VAR`` tokens or URIs with an RFC 3986 scheme (``vault://``, ``aws-sm://``).
+_CREDENTIALS_REFERENCE = re.compile(r"env:|[A-Za-z][A-Za-z0-9+.-]*://", re.ASCII)
+
+
 def validate_credentials_reference(reference: str) -> None:
     """Ensure credential references follow approved secret patterns."""
 
-    if reference.startswith("env:"):
-        return
-    if "://" in reference:
+    if _CREDENTIALS_REFERENCE.match(reference):
         return
     raise ValueError(
         "Credentials reference must be an env:VAR token or secret-manager URI."
     )
 
 
-def _string_values(payload: Mapping[str, object]) -> Iterable[str]:
+_VALUE_SEPARATOR = "\x00"
+_CACHE_KEY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+# Cache key -> monotonic expiry of a passing preflight run, oldest first.
+# Expired entries are dropped when seen and at most ``_PASSED_PREFLIGHTS_SIZE``
+# are kept, so long-lived processes do not accumulate one key per payload.
+_PASSED_PREFLIGHTS: OrderedDict[str, float] = OrderedDict()
+_PASSED_PREFLIGHTS_SIZE = 256
+_PASSED_PREFLIGHTS_LOCK = threading.Lock()
+
+
+def _cached_pass(cache_key: str) -> bool:
+    with _PASSED_PREFLIGHTS_LOCK:
+        expiry = _PASSED_PREFLIGHTS.get(cache_key)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del _PASSED_PREFLIGHTS[cache_key]
+            return False
+        return True
+
+
+def _remember_pass(cache_key: str, expiry: float) -> None:
+    with _PASSED_PREFLIGHTS_LOCK:
+        _PASSED_PREFLIGHTS[cache_key] = expiry
+        _PASSED_PREFLIGHTS.move_to_end(cache_key)
+        now = time.monotonic()
+        while _PASSED_PREFLIGHTS and (
+            len(_PASSED_PREFLIGHTS) > _PASSED_PREFLIGHTS_SIZE
+            or next(iter(_PASSED_PREFLIGHTS.values())) <= now
+        ):
+            _PASSED_PREFLIGHTS.popitem(last=False)
+
+
+@lru_cache(maxsize=32)
+def _policy_fingerprint(policy: ContextPolicy) -> str:
+    serialised = _CACHE_KEY_ENCODER.encode(asdict(policy))
+    return hashlib.blake2b(serialised.encode("utf-8"), digest_size=32).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _compile_topics(topics: frozenset[str]) -> Optional[re.Pattern[str]]:
+    """Build one alternation matching any forbidden topic, longest first."""
+
+    if not topics:
+        return None
+    ordered = sorted(topics, key=lambda topic: (-len(topic), topic))
+    return re.compile("|".join(re.escape(topic) for topic in ordered))
+
+
+_TEXT, _PATH, _MAPPING, _ITERABLE, _OTHER = range(5)
+
+# Payload value kinds keyed by exact type; unseen types are classified once by
+# ``_classify_value`` and remembered, so the walk dispatches with a dict lookup.
+_VALUE_KINDS: Dict[type, int] = {str: _TEXT, dict: _MAPPING, list: _ITERABLE, tuple: _ITERABLE}
+
+
+def _classify_value(kind: type) -> int:
+    if issubclass(kind, str):
+        result = _TEXT
+    elif issubclass(kind, Path):
+        result = _PATH
+    elif issubclass(kind, Mapping):
+        result = _MAPPING
+    elif issubclass(kind, Iterable) and not issubclass(kind, (bytes, bytearray)):
+        result = _ITERABLE
+    else:
+        result = _OTHER
+    _VALUE_KINDS[kind] = result
+    return result
+
+
+def _string_values(payload: Mapping[str, object]) -> List[str]:
+    """Return the string and path values of ``payload`` in depth-first order.
+
+    Nested mappings are walked with an explicit stack of iterators; other
+    iterables contribute only their direct string or path items.
+    """
+
+    # Most CLI payloads are flat string/path mappings; collect those in one
+    # scan and only fall back to the general walk on a nested value.
+    values: List[str] = []
     for value in payload.values():
-        if value is None:
+        if type(value) is str:
+            values.append(value)
+        elif value is None:
             continue
-        if isinstance(value, str):
-            yield value
         elif isinstance(value, Path):
-            yield str(value)
-        elif isinstance(value, Mapping):
-            yield from _string_values(value)
-        elif isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
-            for item in value:
-                if isinstance(item, (str, Path)):
-                    yield str(item)
+            values.append(str(value))
+        else:
+            break
+    else:
+        return values
+
+    values = []
+    stack = [iter(payload.values())]
+    while stack:
+        for value in stack[-1]:
+            kind = _VALUE_KINDS.get(type(value))
+            if kind is None:
+                kind = _classify_value(type(value))
+            if kind == _TEXT:
+                values.append(value)
+            elif kind == _PATH:
+                values.append(str(value))
+            elif kind == _MAPPING:
+                stack.append(iter(value.values()))
+                break
+            elif kind == _ITERABLE:
+                for item in value:
+                    item_kind = _VALUE_KINDS.get(type(item))
+                    if item_kind is None:
+                        item_kind = _classify_value(type(item))
+                    if item_kind == _TEXT:
+                        values.append(item)
+                    elif item_kind == _PATH:
+                        values.append(str(item))
+        else:
+            stack.pop()
+    return values
 
 
 __all__ = [
@@ -0,0 +1,125 @@
+"""JSON serialisation and file-writing helpers shared by CLI commands."""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def dumps_pretty(
+    payload: Any,
+    *,
+    sort_keys: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialise ``payload`` as indented UTF-8 JSON.
+
+    Callers that build their dicts in key order can pass ``sort_keys=False`` to
+    skip the encoder-side sort while keeping the output deterministic.
+    ``default`` converts values the encoder does not support (e.g. ``Path``).
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if sort_keys else orjson.OPT_INDENT_2
+        return orjson.dumps(payload, default=default, option=option)
+    return json.dumps(payload, indent=2, sort_keys=sort_keys, default=default).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON ``data``; decode errors subclass ``json.JSONDecodeError``."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def echo_json(payload: Any, *, sort_keys: bool = True) -> None:
+    """Write ``payload`` to stdout as pretty JSON, bypassing text re-encoding."""
+
+    data = dumps_pretty(payload, sort_keys=sort_keys) + b"\n"
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode("utf-8"))
+        stream.flush()
+        return
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, fsync: bool = False) -> None:
+    """Write ``data`` to ``path`` via a sibling temp file and ``os.replace``.
+
+    Readers never observe a partially written file, and concurrent writers
+    each use their own temp file. ``fsync`` flushes the data to disk before the
+    rename so the new content also survives a crash.
+    """
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(data)
+            if fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+        raise
+
+
+def compress_bytes(data: bytes, codec: str) -> bytes:
+    """Compress ``data`` with ``codec`` (``gzip`` or ``zstd``)."""
+
+    if codec == "gzip":
+        # A fixed mtime keeps the compressed bytes deterministic across runs.
+        return gzip.compress(data, mtime=0)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd artifact compression requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"Unsupported compression codec: {codec}")
+
+
+def read_artifact_bytes(path: Path) -> bytes:
+    """Read an artifact, transparently decompressing based on its suffix."""
+
+    data = path.read_bytes()
+    if path.suffix == COMPRESSION_SUFFIXES["gzip"]:
+        return gzip.decompress(data)
+    if path.suffix == COMPRESSION_SUFFIXES["zstd"]:
+        if zstandard is None:
+            raise ValueError("Reading zstd artifacts requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+__all__ = [
+    "COMPRESSION_SUFFIXES",
+    "atomic_write_bytes",
+    "compress_bytes",
+    "dumps_pretty",
+    "echo_json",
+    "loads_json",
+    "read_artifact_bytes",
+]
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional
 
+from .serialization import atomic_write_bytes, dumps_pretty, loads_json
+
 
 @dataclass(frozen=True)
 class SnapshotState:
@@ -24,9 +25,10 @@ class StateStore:
         self._path = path
 
     def load(self) -> Optional[SnapshotState]:
-        if not self._path.exists():
+        try:
+            data = loads_json(self._path.read_bytes())
+        except FileNotFoundError:
             return None
-        data = json.loads(self._path.read_text(encoding="utf-8"))
         return SnapshotState(
             context=data["context"],
             artifact_root=Path(data["artifact_root"]),
@@ -41,6 +43,6 @@ class StateStore:
         }
         if state.last_snapshot_id:
             payload["last_snapshot_id"] = state.last_snapshot_id
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        atomic_write_bytes(self._path, dumps_pretty(payload, sort_keys=False))
 
 
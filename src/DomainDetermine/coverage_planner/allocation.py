@@ -2,22 +2,38 @@
 
 from __future__ import annotations
 
+import heapq
 import math
-from collections import defaultdict
 from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
+import numpy as np
+
 from .models import AllocationMetadata, AllocationReport, ConstraintConfig, SolverFailureManifest
 
 try:  # pragma: no cover - handled in tests via importorskip
-    import pulp
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_matrix
 except Exception:  # pylint: disable=broad-except
-    pulp = None  # type: ignore[assignment]
+    linprog = None  # type: ignore[assignment]
+    csr_matrix = None  # type: ignore[assignment]
 
+# Solver labels recorded in allocation metadata, bound once at import. scipy
+# ``linprog`` status codes map onto the status names used in reports.
+_LP_SOLVER = "scipy" if linprog is not None else None
+_LP_SOLVER_NAME = "HiGHS"
+_LP_STATUS = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded", 4: "Undefined"}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StratumAllocationInput:
-    """Data required to compute allocations for a stratum."""
+    """Data required to compute allocations for a stratum.
+
+    One instance is created per stratum, so the class uses ``__slots__``; the
+    vectorised passes read them in bulk through ``_StrataArrays.from_inputs``.
+    """
 
     stratum_id: str
     branch_id: str
@@ -32,6 +48,61 @@ class StratumAllocationInput:
     observed_prevalence: Optional[float]
 
 
+@dataclass(frozen=True)
+class _StrataArrays:
+    """Struct-of-arrays view of allocation inputs for vectorised passes.
+
+    Missing variances become ``0.0``, missing risk and cost weights ``nan``, and
+    missing maximums ``inf`` so each column is a plain float array. ``branch_index``
+    maps each stratum to its position in ``branches`` for segmented reductions.
+    """
+
+    ids: Tuple[str, ...]
+    concept_ids: Tuple[str, ...]
+    branches: Tuple[str, ...]
+    branch_index: np.ndarray
+    size: np.ndarray
+    variance: np.ndarray
+    risk: np.ndarray
+    cost: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+    @classmethod
+    def from_inputs(cls, inputs: Sequence[StratumAllocationInput]) -> "_StrataArrays":
+        count = len(inputs)
+        size = np.empty(count)
+        variance = np.empty(count)
+        risk = np.empty(count)
+        cost = np.empty(count)
+        minimum = np.empty(count)
+        maximum = np.empty(count)
+        branch_index = np.empty(count, dtype=np.intp)
+        branch_positions: Dict[str, int] = {}
+        for index, entry in enumerate(inputs):
+            branch_index[index] = branch_positions.setdefault(
+                entry.branch_id, len(branch_positions)
+            )
+            size[index] = entry.size_weight
+            variance[index] = entry.variance if entry.variance is not None else 0.0
+            risk[index] = entry.risk_weight if entry.risk_weight is not None else np.nan
+            cost[index] = entry.cost_weight if entry.cost_weight is not None else np.nan
+            minimum[index] = entry.minimum
+            maximum[index] = entry.maximum if entry.maximum is not None else np.inf
+        return cls(
+            ids=tuple(entry.stratum_id for entry in inputs),
+            concept_ids=tuple(entry.concept_id for entry in inputs),
+            branches=tuple(branch_positions),
+            branch_index=branch_index,
+            size=size,
+            variance=variance,
+            risk=risk,
+            cost=cost,
+            minimum=minimum,
+            maximum=maximum,
+        )
+
+
 @dataclass
 class AllocationResult:
     """Final allocation numbers and audit details for each strategy run."""
@@ -46,143 +117,188 @@ class AllocationResult:
     failure_manifest: Optional[SolverFailureManifest] = None
 
 
-def _largest_remainder(targets: Mapping[str, float], total: int) -> Dict[str, int]:
-    """Deterministic Hamilton method rounding to keep totals exact."""
-
-    floors = {k: math.floor(v) for k, v in targets.items()}
-    remainder = total - sum(floors.values())
-    ranked = sorted(
-        ((targets[k] - floors[k], k) for k in targets),
-        key=lambda item: (-item[0], item[1]),
-    )
-    allocations = floors.copy()
-    for _, stratum_id in ranked[: max(remainder, 0)]:
-        allocations[stratum_id] += 1
-    return allocations
-
-
-def _rescale(values: MutableMapping[str, float], target_total: int) -> None:
-    """Re-normalise fractional allocations after enforcing branch rules."""
-
-    total = sum(values.values())
-    if not total:
-        fraction = 0.0
-    else:
-        fraction = target_total / total
-    for key in list(values):
-        values[key] *= fraction
+def _largest_remainder(
+    targets: np.ndarray,
+    total: int,
+    ids: Sequence[str],
+) -> Dict[str, int]:
+    """Deterministic Hamilton method rounding to keep totals exact.
+
+    Only the ``remainder`` largest fractional parts are selected, via
+    ``np.partition`` rather than a full sort. Fractions tied at the cut-off are
+    granted in stratum-id order so results stay deterministic.
+    """
+
+    floors = np.floor(targets)
+    allocations = floors.astype(np.int64)
+    remainder = total - int(allocations.sum())
+    if remainder >= len(ids):
+        allocations += 1
+    elif remainder > 0:
+        fractions = targets - floors
+        cutoff = np.partition(fractions, len(ids) - remainder)[len(ids) - remainder]
+        above = fractions > cutoff
+        allocations[above] += 1
+        tied = np.flatnonzero(fractions == cutoff).tolist()
+        tied.sort(key=ids.__getitem__)
+        allocations[tied[: remainder - int(above.sum())]] += 1
+    return dict(zip(ids, allocations.tolist()))
+
+
+def _rescale(values: np.ndarray, target_total: int) -> None:
+    """Re-normalise fractional allocations in place after enforcing branch rules."""
+
+    total = values.sum()
+    values *= target_total / total if total else 0.0
 
 
 def _effective_branch_thresholds(
-    inputs: Sequence[StratumAllocationInput],
+    strata: _StrataArrays,
     constraints: ConstraintConfig,
 ) -> Tuple[Mapping[str, int], Mapping[str, int]]:
-    """Return branch-level minimum and maximum quotas after fairness adjustments."""
+    """Return branch-level minimum and maximum quotas after fairness adjustments.
+
+    The thresholds depend only on the branch ids and a few constraint fields,
+    so repeated allocations (e.g. an LP fallback) reuse the cached result.
+    """
+
+    return _compute_branch_thresholds(
+        strata.branches,
+        constraints.total_items,
+        constraints.fairness_floor,
+        constraints.fairness_ceiling,
+        tuple(constraints.branch_minimums.items()),
+        tuple(constraints.branch_maximums.items()),
+    )
 
-    minimums: Dict[str, int] = dict(constraints.branch_minimums)
-    maximums: Dict[str, int] = dict(constraints.branch_maximums)
-    if constraints.fairness_floor is not None:
-        floor_count = math.floor(constraints.total_items * constraints.fairness_floor)
-        for entry in inputs:
-            minimums.setdefault(entry.branch_id, floor_count)
-    if constraints.fairness_ceiling is not None:
-        ceiling_count = math.ceil(constraints.total_items * constraints.fairness_ceiling)
-        for entry in inputs:
-            maximums.setdefault(entry.branch_id, ceiling_count)
-    return minimums, maximums
+
+@lru_cache(maxsize=256)
+def _compute_branch_thresholds(
+    branch_ids: Tuple[str, ...],
+    total_items: int,
+    fairness_floor: Optional[float],
+    fairness_ceiling: Optional[float],
+    base_minimums: Tuple[Tuple[str, int], ...],
+    base_maximums: Tuple[Tuple[str, int], ...],
+) -> Tuple[Mapping[str, int], Mapping[str, int]]:
+    minimums: Dict[str, int] = dict(base_minimums)
+    maximums: Dict[str, int] = dict(base_maximums)
+    if fairness_floor is not None:
+        floor_count = math.floor(total_items * fairness_floor)
+        for branch_id in branch_ids:
+            minimums.setdefault(branch_id, floor_count)
+    if fairness_ceiling is not None:
+        ceiling_count = math.ceil(total_items * fairness_ceiling)
+        for branch_id in branch_ids:
+            maximums.setdefault(branch_id, ceiling_count)
+    # Cached results are shared between callers, so hand out read-only views.
+    return MappingProxyType(minimums), MappingProxyType(maximums)
 
 
 def _apply_branch_thresholds(
-    raw: MutableMapping[str, float],
-    inputs: Sequence[StratumAllocationInput],
+    raw: np.ndarray,
+    strata: _StrataArrays,
     minimums: Mapping[str, int],
     maximums: Mapping[str, int],
     target_total: int,
 ) -> List[str]:
-    """Apply fairness floors/ceilings at the branch level and capture notes."""
+    """Apply fairness floors/ceilings at the branch level and capture notes.
+
+    Branch totals come from one ``bincount`` per pass; because branches are
+    disjoint, every adjustment can be computed up front and applied at once.
+    """
 
     notes: List[str] = []
-    branch_map: Dict[str, List[StratumAllocationInput]] = defaultdict(list)
-    for entry in inputs:
-        branch_map[entry.branch_id].append(entry)
+    positions = {branch: index for index, branch in enumerate(strata.branches)}
+    members = np.bincount(strata.branch_index, minlength=len(strata.branches))
+    totals = np.bincount(strata.branch_index, weights=raw, minlength=len(strata.branches))
+    lift = np.zeros(len(strata.branches))
     for branch, minimum in minimums.items():
-        current = sum(raw[e.stratum_id] for e in branch_map.get(branch, []))
+        position = positions.get(branch)
+        current = float(totals[position]) if position is not None else 0
         if current >= minimum:
             continue
         shortfall = minimum - current
         notes.append(f"Raised branch {branch} by {shortfall} items to meet minimum")
-        per_stratum = shortfall / max(len(branch_map.get(branch, [])), 1)
-        for entry in branch_map.get(branch, []):
-            raw[entry.stratum_id] += per_stratum
+        if position is not None:
+            lift[position] = shortfall / members[position]
+    raw += lift[strata.branch_index]
     _rescale(raw, target_total)
+    totals = np.bincount(strata.branch_index, weights=raw, minlength=len(strata.branches))
+    drop = np.zeros(len(strata.branches))
     for branch, maximum in maximums.items():
-        current = sum(raw[e.stratum_id] for e in branch_map.get(branch, []))
+        position = positions.get(branch)
+        current = float(totals[position]) if position is not None else 0
         if current <= maximum:
             continue
         excess = current - maximum
         notes.append(f"Reduced branch {branch} by {excess} items to honor maximum")
-        per_stratum = excess / max(len(branch_map.get(branch, [])), 1)
-        for entry in branch_map.get(branch, []):
-            raw[entry.stratum_id] = max(0.0, raw[entry.stratum_id] - per_stratum)
+        if position is not None:
+            drop[position] = excess / members[position]
+    np.maximum(raw - drop[strata.branch_index], 0.0, out=raw)
     _rescale(raw, target_total)
     return notes
 
 
 def _compute_weights(
-    inputs: Sequence[StratumAllocationInput],
+    strata: _StrataArrays,
     constraints: ConstraintConfig,
-) -> Dict[str, float]:
-    """Return strategy-specific weights per stratum prior to mixing."""
+) -> np.ndarray:
+    """Return strategy-specific weights per stratum prior to mixing.
+
+    Weights are aligned with ``strata.ids``; the strategy is dispatched once
+    and applied to every stratum in a single vectorised pass.
+    """
 
     strategy = constraints.allocation_strategy
     if strategy == "cost_constrained":
         raise ValueError("cost_constrained strategy must be solved via LP")
-    weights: Dict[str, float] = {}
-    for entry in inputs:
-        if strategy == "uniform":
-            weight = 1.0
-        elif strategy == "proportional":
-            weight = max(entry.size_weight, 1e-6)
-        elif strategy == "neyman":
-            variance = entry.variance if entry.variance is not None else 0.0
-            weight = max(entry.size_weight, 1e-6) * max(variance, 1e-6)
-        else:
-            raise ValueError(f"Unknown allocation strategy: {strategy}")
-        if entry.risk_weight is not None:
-            weight *= max(entry.risk_weight, 1e-6)
-        weights[entry.stratum_id] = weight
-    total = sum(weights.values())
-    if total <= 0:
-        return {entry.stratum_id: 1.0 for entry in inputs}
+    if strategy == "uniform":
+        weights = np.ones(len(strata.ids))
+    elif strategy == "proportional":
+        weights = np.maximum(strata.size, 1e-6)
+    elif strategy == "neyman":
+        weights = np.maximum(strata.size, 1e-6) * np.maximum(strata.variance, 1e-6)
+    else:
+        raise ValueError(f"Unknown allocation strategy: {strategy}")
+    risk = strata.risk
+    weights = np.where(np.isnan(risk), weights, weights * np.maximum(risk, 1e-6))
+    if weights.sum() <= 0:
+        return np.ones(len(strata.ids))
     return weights
 
 
-def _apply_prevalence_mixing(
-    raw: MutableMapping[str, float],
-    inputs: Sequence[StratumAllocationInput],
+def _seed_allocation(
+    weights: np.ndarray,
+    strata: _StrataArrays,
     constraints: ConstraintConfig,
-) -> None:
-    """Blend observed prevalence with uniform allocations as configured."""
+) -> np.ndarray:
+    """Turn strategy weights into fractional quotas before branch thresholds.
 
-    if not constraints.observed_prevalence:
-        return
+    Normalises the weights, blends in observed prevalence as configured, floors
+    each stratum at its minimum and rescales to the budget, working on one
+    share array instead of a separate pass per step.
+    """
+
+    total = constraints.total_items
+    shares = weights / weights.sum()
+    prevalence = constraints.observed_prevalence
     mix = constraints.mixing_parameter
-    if mix <= 0.0:
-        return
-    prevalence_total = sum(constraints.observed_prevalence.values())
-    if prevalence_total <= 0:
-        return
-    normalized_prev = {
-        entry.stratum_id: constraints.observed_prevalence.get(entry.concept_id, 0.0) / prevalence_total
-        for entry in inputs
-    }
-    current_total = sum(raw.values())
-    if current_total <= 0:
-        return
-    for entry in inputs:
-        existing_ratio = raw[entry.stratum_id] / current_total
-        blended = mix * normalized_prev[entry.stratum_id] + (1.0 - mix) * existing_ratio
-        raw[entry.stratum_id] = blended * current_total
+    if prevalence and mix > 0.0 and total > 0:
+        prevalence_total = sum(prevalence.values())
+        if prevalence_total > 0:
+            normalized_prev = np.fromiter(
+                (prevalence.get(concept_id, 0.0) for concept_id in strata.concept_ids),
+                dtype=float,
+                count=len(strata.concept_ids),
+            )
+            normalized_prev *= mix / prevalence_total
+            shares *= 1.0 - mix
+            shares += normalized_prev
+    shares *= total
+    np.maximum(shares, strata.minimum, out=shares)
+    _rescale(shares, total)
+    return shares
 
 
 def _respect_maximums(
@@ -193,46 +309,37 @@ def _respect_maximums(
     """Enforce per-stratum maximums without violating the global budget."""
 
     notes: List[str] = []
-    capacity = {
-        entry.stratum_id: (
-            entry.maximum - rounded[entry.stratum_id] if entry.maximum is not None else float("inf")
-        )
+    # Receivers only ever fill up to their own maximum, so the over-cap strata
+    # are known up front and each is drained into the roomiest receivers via a
+    # max-heap keyed on (-capacity, stratum_id), so ties go to the lowest id.
+    overflowing = [
+        entry
         for entry in inputs
-    }
-    changed = True
-    while changed:
-        changed = False
+        if entry.maximum is not None and rounded[entry.stratum_id] > entry.maximum
+    ]
+    if overflowing:
+        receivers: List[Tuple[float, str]] = []
         for entry in inputs:
+            if entry.maximum is None:
+                receivers.append((-math.inf, entry.stratum_id))
+            elif rounded[entry.stratum_id] < entry.maximum:
+                receivers.append((rounded[entry.stratum_id] - entry.maximum, entry.stratum_id))
+        heapq.heapify(receivers)
+        for entry in overflowing:
             maximum = entry.maximum
-            if maximum is None:
-                continue
-            current = rounded[entry.stratum_id]
-            if current <= maximum:
-                continue
-            excess = current - maximum
+            excess = rounded[entry.stratum_id] - maximum
             rounded[entry.stratum_id] = maximum
             notes.append(f"Capped stratum {entry.stratum_id} at maximum {maximum}")
-            receivers = sorted(
-                (
-                    (capacity.get(other.stratum_id, 0.0), other.stratum_id)
-                    for other in inputs
-                    if other.stratum_id != entry.stratum_id
-                ),
-                key=lambda item: (-item[0], item[1]),
-            )
-            for _, receiver_id in receivers:
-                available = capacity.get(receiver_id, 0.0)
-                if available <= 0:
-                    continue
-                take = min(excess, available)
-                rounded[receiver_id] += int(take)
-                capacity[receiver_id] = max(0.0, available - take)
-                excess -= int(take)
-                if excess <= 0:
-                    break
+            while excess > 0 and receivers:
+                negative_capacity, receiver_id = heapq.heappop(receivers)
+                available = -negative_capacity
+                take = int(min(excess, available))
+                rounded[receiver_id] += take
+                excess -= take
+                if available - take > 0:
+                    heapq.heappush(receivers, (take - available, receiver_id))
             if excess > 0:
                 raise ValueError("Unable to redistribute quota without violating maximums")
-            changed = True
     delta = total - sum(rounded.values())
     if delta != 0:
         adjust_target = max(rounded, key=rounded.get)
@@ -244,31 +351,27 @@ def _respect_maximums(
 def _allocate_with_strategy(
     inputs: Sequence[StratumAllocationInput],
     constraints: ConstraintConfig,
+    strata: Optional[_StrataArrays] = None,
 ) -> AllocationResult:
     """Run the heuristic allocation strategies (uniform/proportional/neyman)."""
 
-    weights = _compute_weights(inputs, constraints)
-    denominator = sum(weights.values())
-    raw: MutableMapping[str, float] = {
-        stratum_id: constraints.total_items * weight / denominator
-        for stratum_id, weight in weights.items()
-    }
-    _apply_prevalence_mixing(raw, inputs, constraints)
-    for entry in inputs:
-        minimum = entry.minimum
-        if raw[entry.stratum_id] < minimum:
-            raw[entry.stratum_id] = float(minimum)
-    _rescale(raw, constraints.total_items)
-    minimums, maximums = _effective_branch_thresholds(inputs, constraints)
-    fairness_notes = _apply_branch_thresholds(raw, inputs, minimums, maximums, constraints.total_items)
-    rounded = _largest_remainder(raw, constraints.total_items)
+    if strata is None:
+        strata = _StrataArrays.from_inputs(inputs)
+    weights = _compute_weights(strata, constraints)
+    raw = _seed_allocation(weights, strata, constraints)
+    minimums, maximums = _effective_branch_thresholds(strata, constraints)
+    fairness_notes = _apply_branch_thresholds(
+        raw, strata, minimums, maximums, constraints.total_items
+    )
+    pre_round = dict(zip(strata.ids, raw.tolist()))
+    rounded = _largest_remainder(raw, constraints.total_items, strata.ids)
     rounding_delta = {
-        stratum_id: rounded[stratum_id] - raw[stratum_id]
+        stratum_id: rounded[stratum_id] - pre_round[stratum_id]
         for stratum_id in rounded
     }
     deviations = list(_respect_maximums(rounded, inputs, constraints.total_items))
     return AllocationResult(
-        pre_round=dict(raw),
+        pre_round=pre_round,
         rounded=dict(rounded),
         rounding_delta=rounding_delta,
         fairness_notes=tuple(fairness_notes),
@@ -278,7 +381,7 @@ def _allocate_with_strategy(
 
 
 def _infer_violations(
-    inputs: Sequence[StratumAllocationInput],
+    strata: _StrataArrays,
     constraints: ConstraintConfig,
     minimums: Mapping[str, int],
     maximums: Mapping[str, int],
@@ -286,13 +389,18 @@ def _infer_violations(
     """Best-effort heuristics for explaining infeasible LP constraints."""
 
     messages: List[str] = []
-    total_minimum = sum(entry.minimum for entry in inputs)
+    total_minimum = int(strata.minimum.sum())
     if total_minimum > constraints.total_items:
         messages.append(
             f"sum(stratum_minimums)={total_minimum} exceeds total_items={constraints.total_items}"
         )
+    positions = {branch: index for index, branch in enumerate(strata.branches)}
+    branch_minimums = np.bincount(
+        strata.branch_index, weights=strata.minimum, minlength=len(strata.branches)
+    )
     for branch, minimum in minimums.items():
-        branch_minimum = sum(entry.minimum for entry in inputs if entry.branch_id == branch)
+        position = positions.get(branch)
+        branch_minimum = int(branch_minimums[position]) if position is not None else 0
         if branch_minimum > constraints.total_items:
             messages.append(
                 f"branch_minimum[{branch}]={branch_minimum} exceeds total_items={constraints.total_items}"
@@ -310,67 +418,85 @@ def _infer_violations(
 def _allocate_cost_constrained(
     inputs: Sequence[StratumAllocationInput],
     constraints: ConstraintConfig,
+    strata: Optional[_StrataArrays] = None,
 ) -> AllocationResult:
     """Solve the cost-constrained optimisation via a deterministic LP solver."""
 
-    minimums, maximums = _effective_branch_thresholds(inputs, constraints)
+    if strata is None:
+        strata = _StrataArrays.from_inputs(inputs)
+    minimums, maximums = _effective_branch_thresholds(strata, constraints)
     solver_details: Dict[str, Any] = {
         "requested_strategy": "cost_constrained",
-        "solver": getattr(pulp, "__name__", "pulp") if pulp else None,
+        "solver": _LP_SOLVER,
     }
     violated: List[str] = []
     try:
-        if pulp is None:
-            raise RuntimeError("PuLP solver is not installed")
-
-        problem = pulp.LpProblem("coverage_cost_constrained", pulp.LpMaximize)
-        variables = {}
-        for entry in inputs:
-            low_bound = float(entry.minimum)
-            up_bound = float(entry.maximum) if entry.maximum is not None else None
-            variables[entry.stratum_id] = pulp.LpVariable(
-                entry.stratum_id,
-                lowBound=low_bound,
-                upBound=up_bound,
-                cat="Continuous",
+        if linprog is None:
+            raise RuntimeError("SciPy HiGHS solver is not installed")
+
+        # HiGHS runs in-process, so the model goes straight from arrays to the
+        # solver with no LP file or CBC subprocess in between.
+        count = len(strata.ids)
+        info = np.where(np.isnan(strata.risk), np.maximum(strata.size, 1.0), strata.risk)
+        cost = np.where(np.isnan(strata.cost) | (strata.cost == 0.0), 1.0, strata.cost)
+        objective = -(info / cost)  # linprog minimises
+
+        # Each branch threshold becomes one sparse row holding a coefficient for
+        # every member stratum (-1 for minimums, +1 for maximums), so the
+        # matrix is assembled from (data, (row, col)) triplets in O(strata).
+        positions = {branch: index for index, branch in enumerate(strata.branches)}
+        columns = np.arange(count)
+        row_names: List[str] = []
+        bounds_ub: List[float] = []
+        triplet_rows: List[np.ndarray] = []
+        triplet_cols: List[np.ndarray] = []
+        triplet_data: List[np.ndarray] = []
+        for prefix, thresholds, sign in (("min", minimums, -1.0), ("max", maximums, 1.0)):
+            row_of_branch = np.full(len(strata.branches), -1, dtype=np.intp)
+            for branch, threshold in thresholds.items():
+                if branch in positions:
+                    row_of_branch[positions[branch]] = len(row_names)
+                    row_names.append(f"{prefix}_branch_{branch}")
+                    bounds_ub.append(sign * float(threshold))
+            stratum_rows = row_of_branch[strata.branch_index]
+            member = stratum_rows >= 0
+            triplet_rows.append(stratum_rows[member])
+            triplet_cols.append(columns[member])
+            triplet_data.append(np.full(int(member.sum()), sign))
+        constraint_matrix = None
+        if row_names:
+            constraint_matrix = csr_matrix(
+                (
+                    np.concatenate(triplet_data),
+                    (np.concatenate(triplet_rows), np.concatenate(triplet_cols)),
+                ),
+                shape=(len(row_names), count),
             )
 
-        objective_terms = []
-        for entry in inputs:
-            info = entry.risk_weight if entry.risk_weight is not None else max(entry.size_weight, 1.0)
-            cost = entry.cost_weight if entry.cost_weight not in (None, 0.0) else 1.0
-            coefficient = info / cost
-            objective_terms.append(coefficient * variables[entry.stratum_id])
-        problem += pulp.lpSum(objective_terms)
-
-        problem += pulp.lpSum(variables.values()) == constraints.total_items, "total_items"
-
-        branch_variables: Dict[str, List[Any]] = defaultdict(list)
-        for entry in inputs:
-            branch_variables[entry.branch_id].append(variables[entry.stratum_id])
-        for branch, minimum in minimums.items():
-            if branch_variables.get(branch):
-                problem += pulp.lpSum(branch_variables[branch]) >= minimum, f"min_branch_{branch}"
-        for branch, maximum in maximums.items():
-            if branch_variables.get(branch):
-                problem += pulp.lpSum(branch_variables[branch]) <= maximum, f"max_branch_{branch}"
-
         time_limit = int(constraints.slos.get("lp_time_limit", 15)) if constraints.slos else 15
-        solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit)
-        status_code = problem.solve(solver)
-        status = pulp.LpStatus.get(status_code, str(status_code))
+        result = linprog(
+            objective,
+            A_ub=constraint_matrix,
+            b_ub=np.array(bounds_ub) if row_names else None,
+            A_eq=csr_matrix(np.ones((1, count))),
+            b_eq=np.array([float(constraints.total_items)]),
+            bounds=np.column_stack((strata.minimum, strata.maximum)),
+            method="highs",
+            options={"time_limit": time_limit},
+        )
+        status = _LP_STATUS.get(result.status, str(result.status))
         solver_details.update(
             {
                 "status": status,
-                "solver_name": getattr(solver, "name", "PULP_CBC_CMD"),
-                "objective_value": (
-                    pulp.value(problem.objective) if status == "Optimal" else None
-                ),
+                "solver_name": _LP_SOLVER_NAME,
+                "objective_value": -result.fun if status == "Optimal" else None,
             }
         )
-        constraint_slacks = {
-            name: constraint.slack for name, constraint in problem.constraints.items()
-        }
+        constraint_slacks: Dict[str, Optional[float]] = {"total_items": None}
+        constraint_slacks.update(dict.fromkeys(row_names))
+        if result.x is not None:
+            constraint_slacks["total_items"] = float(result.con[0])
+            constraint_slacks.update(zip(row_names, result.slack.tolist()))
         solver_details["constraint_slacks"] = constraint_slacks
         if status != "Optimal":
             for name, slack in constraint_slacks.items():
@@ -378,18 +504,14 @@ def _allocate_cost_constrained(
                     violated.append(f"{name} slack={slack}")
             raise RuntimeError(f"LP solver exited with status {status}")
 
-        raw: Dict[str, float] = {
-            sid: float(variable.value() or 0.0) for sid, variable in variables.items()
-        }
-        total_raw = sum(raw.values())
+        raw = result.x
+        total_raw = raw.sum()
         if total_raw and abs(total_raw - constraints.total_items) > 1e-6:
-            scale = constraints.total_items / total_raw
-            for sid in raw:
-                raw[sid] *= scale
+            raw *= constraints.total_items / total_raw
     except Exception as exc:  # noqa: BLE001 - propagate failure through manifest
         reason = str(exc)
         if not violated:
-            violated = _infer_violations(inputs, constraints, minimums, maximums)
+            violated = _infer_violations(strata, constraints, minimums, maximums)
         failure = SolverFailureManifest(
             strategy="cost_constrained",
             reason=reason,
@@ -400,7 +522,7 @@ def _allocate_cost_constrained(
             constraints,
             allocation_strategy=fallback_strategy,
         )
-        result = _allocate_with_strategy(inputs, fallback_constraints)
+        result = _allocate_with_strategy(inputs, fallback_constraints, strata)
         deviations = list(result.deviations)
         deviations.append(f"Fell back to {fallback_strategy} due to LP failure: {reason}")
         result.deviations = tuple(deviations)
@@ -422,14 +544,15 @@ def _allocate_cost_constrained(
     minimums_note = ', '.join(f"{k}>={v}" for k, v in minimums.items()) or 'none'
     maximums_note = ', '.join(f"{k}<={v}" for k, v in maximums.items()) or 'none'
     fairness_notes.append(f"Branch minima: {minimums_note}; maxima: {maximums_note}")
-    rounded = _largest_remainder(raw, constraints.total_items)
+    pre_round = dict(zip(strata.ids, raw.tolist()))
+    rounded = _largest_remainder(raw, constraints.total_items, strata.ids)
     rounding_delta = {
-        stratum_id: rounded[stratum_id] - raw[stratum_id]
+        stratum_id: rounded[stratum_id] - pre_round[stratum_id]
         for stratum_id in rounded
     }
     deviations = list(_respect_maximums(rounded, inputs, constraints.total_items))
     return AllocationResult(
-        pre_round=dict(raw),
+        pre_round=pre_round,
         rounded=dict(rounded),
         rounding_delta=rounding_delta,
         fairness_notes=tuple(fairness_notes),
@@ -446,9 +569,12 @@ def allocate_quotas(
     """Allocate quotas across strata according to the requested strategy."""
 
     constraints.validate()
+    # Build the struct-of-arrays view (and its branch index) once; the LP path
+    # shares it with its fallback and violation diagnostics.
+    strata = _StrataArrays.from_inputs(inputs)
     if constraints.allocation_strategy == "cost_constrained":
-        return _allocate_cost_constrained(inputs, constraints)
-    return _allocate_with_strategy(inputs, constraints)
+        return _allocate_cost_constrained(inputs, constraints, strata)
+    return _allocate_with_strategy(inputs, constraints, strata)
 
 
 def build_allocation_metadata(
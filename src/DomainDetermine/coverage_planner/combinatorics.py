@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from itertools import product
-from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 FacetSelection = Tuple[Tuple[str, str], ...]
+InvalidSet = FrozenSet[Tuple[str, str]]
 
 
 def _normalize_combination(combo: Iterable[Tuple[str, str]]) -> FacetSelection:
@@ -13,14 +16,19 @@ def _normalize_combination(combo: Iterable[Tuple[str, str]]) -> FacetSelection:
     return tuple(sorted(combo, key=lambda item: item[0]))
 
 
-def _is_invalid(combo: FacetSelection, invalid_sets: Sequence[Sequence[Tuple[str, str]]]) -> bool:
+def _freeze_invalid(
+    invalid_combinations: Sequence[Sequence[Tuple[str, str]]],
+) -> Tuple[InvalidSet, ...]:
+    """Convert policy-defined invalid combinations to frozensets once per call."""
+    return tuple(frozenset(invalid) for invalid in invalid_combinations)
+
+
+def _is_invalid(combo: Iterable[Tuple[str, str]], invalid_sets: Sequence[InvalidSet]) -> bool:
     """Check whether a combination violates a policy-defined invalid set."""
-    frozen_combo = set(combo)
-    for invalid in invalid_sets:
-        invalid_set = set(invalid)
-        if invalid_set.issubset(frozen_combo):
-            return True
-    return False
+    if not invalid_sets:
+        return False
+    frozen_combo = frozenset(combo)
+    return any(invalid <= frozen_combo for invalid in invalid_sets)
 
 
 def _all_pairs(mapping: Mapping[str, Sequence[str]]) -> List[FacetSelection]:
@@ -35,49 +43,130 @@ def _all_pairs(mapping: Mapping[str, Sequence[str]]) -> List[FacetSelection]:
     return pairs
 
 
+def _first_admissible(
+    choices: Sequence[Sequence[str]],
+    facet_names: Sequence[str],
+    invalid_sets: Sequence[InvalidSet],
+) -> Optional[FacetSelection]:
+    """Return the first Cartesian combination of ``choices`` that is not invalid."""
+    for full_combo in product(*choices):
+        candidate = _normalize_combination(zip(facet_names, full_combo))
+        if not _is_invalid(candidate, invalid_sets):
+            return candidate
+    return None
+
+
 def generate_pairwise_combinations(
     facets: Mapping[str, Sequence[str]],
     invalid_combinations: Sequence[Sequence[Tuple[str, str]]],
 ) -> List[FacetSelection]:
     """Generate deterministic combinations that cover valid facet pairs for audits."""
 
-    all_pairs = [pair for pair in _all_pairs(facets) if not _is_invalid(pair, invalid_combinations)]
-    uncovered = set(all_pairs)
-    if not uncovered:
+    invalid_sets = _freeze_invalid(invalid_combinations)
+    all_pairs = [pair for pair in _all_pairs(facets) if not _is_invalid(pair, invalid_sets)]
+    if not all_pairs:
         return []
 
     facet_names = list(facets.keys())
+    # Each facet value owns one slot of a boolean selection vector. For every
+    # slot we keep the pairs touching it and the slot at their other end, so a
+    # candidate value is scored only against the pairs it can complete.
+    slot_of: Dict[Tuple[str, str], int] = {}
+    facet_of_slot: List[int] = []
+    for facet_index, facet_name in enumerate(facet_names):
+        for value in facets[facet_name]:
+            if (facet_name, value) not in slot_of:
+                slot_of[(facet_name, value)] = len(slot_of)
+                facet_of_slot.append(facet_index)
+    slot_items = list(slot_of)
+    unique_pairs = dict.fromkeys((slot_of[item_a], slot_of[item_b]) for item_a, item_b in all_pairs)
+    pair_slots = np.array(list(unique_pairs), dtype=np.intp).reshape(-1, 2)
+    touching: List[List[int]] = [[] for _ in slot_of]
+    partners: List[List[int]] = [[] for _ in slot_of]
+    for pair_index, (slot_a, slot_b) in enumerate(unique_pairs):
+        touching[slot_a].append(pair_index)
+        partners[slot_a].append(slot_b)
+        touching[slot_b].append(pair_index)
+        partners[slot_b].append(slot_a)
+    pairs_of_slot = [np.array(indices, dtype=np.intp) for indices in touching]
+    partners_of_slot = [np.array(slots, dtype=np.intp) for slots in partners]
+    partner_facets = [np.array(facet_of_slot, dtype=np.intp)[slots] for slots in partners_of_slot]
+    uncovered = np.ones(len(unique_pairs), dtype=bool)
+    remaining = len(unique_pairs)
     combinations: List[FacetSelection] = []
 
-    while uncovered:
+    def covered_by(row_slots: List[int]) -> np.ndarray:
+        selected = np.zeros(len(slot_of), dtype=bool)
+        selected[row_slots] = True
+        return np.unique(
+            np.concatenate(
+                [pairs_of_slot[slot][selected[partners_of_slot[slot]]] for slot in row_slots]
+            )
+        )
+
+    def retire(pair_indices: np.ndarray) -> None:
+        # Drop finished pairs from the per-slot indices of both endpoints so
+        # later scoring only walks pairs that are still open.
+        uncovered[pair_indices] = False
+        for slot in np.unique(pair_slots[pair_indices]).tolist():
+            still_open = uncovered[pairs_of_slot[slot]]
+            pairs_of_slot[slot] = pairs_of_slot[slot][still_open]
+            partners_of_slot[slot] = partners_of_slot[slot][still_open]
+            partner_facets[slot] = partner_facets[slot][still_open]
+
+    while remaining:
         working: Dict[str, str] = {}
-        for facet_name in facet_names:
-            # Greedy heuristic: choose the value covering the largest number of uncovered pairs.
+        selected = np.zeros(len(slot_of), dtype=bool)
+        assigned = np.zeros(len(facet_names), dtype=bool)
+        for facet_index, facet_name in enumerate(facet_names):
+            # Greedy heuristic: prefer the value completing the most uncovered pairs with
+            # values already chosen, then the one with most uncovered pairs left to complete
+            # in facets not yet assigned. The look-ahead lets the first facets pick values
+            # that still need coverage instead of always taking their first value.
             best_value = None
-            best_score = -1
+            best_score = (-1, -1)
             for value in facets[facet_name]:
-                candidate = _normalize_combination(tuple(working.items()) + ((facet_name, value),))
-                if _is_invalid(candidate, invalid_combinations):
+                item = (facet_name, value)
+                if _is_invalid((*working.items(), item), invalid_sets):
                     continue
-                covered_pairs = sum(
-                    1 for pair in uncovered if set(pair).issubset(set(candidate))
-                )
-                if covered_pairs > best_score:
-                    best_score = covered_pairs
+                slot = slot_of[item]
+                completed = int(np.count_nonzero(selected[partners_of_slot[slot]]))
+                pending = int(np.count_nonzero(~assigned[partner_facets[slot]]))
+                score = (completed, pending)
+                if score > best_score:
+                    best_score = score
                     best_value = value
             if best_value is None:
                 best_value = facets[facet_name][0]
             working[facet_name] = best_value
-        normalized = _normalize_combination(tuple(working.items()))
-        if _is_invalid(normalized, invalid_combinations):
+            selected[slot_of[(facet_name, best_value)]] = True
+            assigned[facet_index] = True
+        normalized: Optional[FacetSelection] = _normalize_combination(tuple(working.items()))
+        if _is_invalid(normalized, invalid_sets):
             # If greedy selection hits an invalid junction, fall back to admissible Cartesian search.
-            for full_combo in product(*[facets[name] for name in facet_names]):
-                candidate = _normalize_combination(zip(facet_names, full_combo))
-                if not _is_invalid(candidate, invalid_combinations):
-                    normalized = candidate
-                    break
+            normalized = (
+                _first_admissible([facets[name] for name in facet_names], facet_names, invalid_sets)
+                or normalized
+            )
+        covered = covered_by([slot_of[item] for item in normalized])
+        if not covered.size:
+            # Invalid combinations can steer the greedy pass away from every remaining pair;
+            # build a row around the first one explicitly, or drop it if no admissible
+            # combination contains it, so the loop always makes progress.
+            pair_index = min(int(pairs[0]) for pairs in pairs_of_slot if pairs.size)
+            required = dict(slot_items[slot] for slot in pair_slots[pair_index])
+            choices = [
+                (required[name],) if name in required else facets[name] for name in facet_names
+            ]
+            normalized = _first_admissible(choices, facet_names, invalid_sets)
+            if normalized is None:
+                retire(np.array([pair_index], dtype=np.intp))
+                remaining -= 1
+                continue
+            covered = covered_by([slot_of[item] for item in normalized])
         combinations.append(normalized)
-        uncovered -= {pair for pair in list(uncovered) if set(pair).issubset(set(normalized))}
+        retire(covered)
+        remaining -= covered.size
 
     combinations.sort()  # Stable ordering keeps outputs reproducible for downstream diffs.
     return combinations
@@ -90,10 +179,11 @@ def expand_full_cartesian(
     """Return the full Cartesian product minus invalid combinations for small grids."""
 
     facet_names = list(facets)
+    invalid_sets = _freeze_invalid(invalid_combinations)
     raw: List[FacetSelection] = []
     for values in product(*[facets[name] for name in facet_names]):
         combo = _normalize_combination(zip(facet_names, values))
-        if _is_invalid(combo, invalid_combinations):
+        if _is_invalid(combo, invalid_sets):
             continue
         raw.append(combo)
     return raw
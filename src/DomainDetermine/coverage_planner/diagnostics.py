@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import math
-from collections import Counter, defaultdict
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from collections import Counter
+from typing import Dict, Iterable, Mapping, Sequence
 
 from .models import ConstraintConfig, CoveragePlanDiagnostics, CoveragePlanRow
 
@@ -39,11 +39,17 @@ def _gini(values: Sequence[int]) -> float:
 
 def _quotas_by_facet(rows: Sequence[CoveragePlanRow]) -> Mapping[str, Mapping[str, int]]:
     """Aggregate quotas for each facet value to support fairness dashboards."""
-    buckets: MutableMapping[str, Counter[str]] = defaultdict(Counter)
+    # Rows usually share one facet schema, so seed the buckets from the first
+    # row and accumulate into plain dicts; later rows may still add facets.
+    buckets: Dict[str, Dict[str, int]] = {name: {} for name in rows[0].facets} if rows else {}
     for row in rows:
+        quota = row.planned_quota
         for facet_name, facet_value in row.facets.items():
-            buckets[facet_name][facet_value] += row.planned_quota
-    return {name: dict(counter) for name, counter in buckets.items()}
+            bucket = buckets.get(facet_name)
+            if bucket is None:
+                bucket = buckets[facet_name] = {}
+            bucket[facet_value] = bucket.get(facet_value, 0) + quota
+    return buckets
 
 
 def build_diagnostics(
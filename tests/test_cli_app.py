@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib
 import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler
 from pathlib import Path
 from typing import Dict
 
+import pytest
 from typer.testing import CliRunner
 
-from DomainDetermine.cli.app import app
+from DomainDetermine.cli.app import _hash_path, _write_artifact, app
+from DomainDetermine.cli.config import load_cli_config
+from DomainDetermine.cli.logging import configure_logging, shutdown_logging
 from DomainDetermine.cli.plugins import registry as plugin_registry
+from DomainDetermine.cli.profiles import ProfileManifest, ProfileStep
+from DomainDetermine.cli.serialization import read_artifact_bytes
 
 CONFIG_TEXT = """
 default_context = "dev"
@@ -183,6 +197,111 @@ source = "data/legal.json"
     assert "[dry-run] Profile execution skipped" in result.stdout
 
 
+def test_cli_profile_run_parallel_executes_steps(tmp_path: Path) -> None:
+    config_path = write_config(tmp_path)
+    for name in ("first", "second"):
+        (tmp_path / f"{name}.json").write_text("{}", encoding="utf-8")
+    manifest = tmp_path / "parallel.toml"
+    manifest.write_text(
+        f"""
+name = "parallel"
+cli_version = "0.1.0"
+
+[[steps]]
+id = "first"
+verb = "ingest"
+source = "{tmp_path / 'first.json'}"
+
+[[steps]]
+id = "second"
+verb = "ingest"
+source = "{tmp_path / 'second.json'}"
+
+[[steps]]
+verb = "plan"
+plan_spec = "{tmp_path / 'first.json'}"
+depends_on = ["first", "second"]
+""",
+        encoding="utf-8",
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["--config", str(config_path), "profile", "run", str(manifest), "--parallel"],
+        env={"DD_CONTEXT_HOME": str(tmp_path / "state")},
+    )
+
+    assert result.exit_code == 0, result.stdout
+    ingest_manifest = json.loads(
+        (tmp_path / "artifacts" / ".cli_state" / "ingest.json").read_text(encoding="utf-8")
+    )
+    assert len(ingest_manifest) == 2
+    assert (tmp_path / "artifacts" / "plan" / "first.json").exists()
+
+
+def test_cli_profile_run_parallel_isolates_plugin_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = write_config(tmp_path)
+    for name in ("first", "second"):
+        (tmp_path / f"{name}.json").write_text("{}", encoding="utf-8")
+    manifest = tmp_path / "plugins.toml"
+    manifest.write_text(
+        f"""
+name = "plugins"
+cli_version = "0.1.0"
+
+[[steps]]
+id = "first"
+verb = "ingest"
+source = "{tmp_path / 'first.json'}"
+loader = "chatty_loader"
+
+[[steps]]
+id = "second"
+verb = "ingest"
+source = "{tmp_path / 'second.json'}"
+loader = "chatty_loader"
+""",
+        encoding="utf-8",
+    )
+    # The first plugin to start leaves its sandbox while the second is still
+    # inside, the interleaving that used to strand ``sys.stdout``.
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    second_started = threading.Event()
+    order = []
+
+    def chatty_loader(runtime, source: str, artifact: str, **_: Dict[str, str]) -> None:
+        order.append(source)
+        print(f"loading {source}")
+        if len(order) == 1:
+            assert second_started.wait(timeout=5)
+        else:
+            second_started.set()
+            time.sleep(0.2)
+        Path(artifact).with_suffix(".plugin").write_text(f"plugin:{source}", encoding="utf-8")
+
+    stdout, stderr = sys.stdout, sys.stderr
+    plugin_registry.register("loaders", chatty_loader)
+    runner = CliRunner()
+    try:
+        result = runner.invoke(
+            app,
+            ["--config", str(config_path), "profile", "run", str(manifest), "--parallel"],
+            env={"DD_CONTEXT_HOME": str(tmp_path / "state")},
+        )
+    finally:
+        plugin_registry.unregister("loaders", "chatty_loader")
+
+    assert result.exit_code == 0, result.stdout
+    assert sys.stdout is stdout and sys.stderr is stderr
+    assert "loading" not in result.stdout
+    assert result.stdout.count("[ok] ingest") == 2
+    markers = sorted((tmp_path / "artifacts" / "ingest").glob("*.plugin"))
+    assert [marker.stem for marker in markers] == ["first", "second"]
+
+
 def test_cli_publish_requires_license_flags(tmp_path: Path) -> None:
     config_path = write_config(
         tmp_path,
@@ -349,3 +468,115 @@ def test_cli_calibrate_mapping(tmp_path: Path, monkeypatch) -> None:
     assert result.exit_code == 0
 
 
+def test_shutdown_logging_detaches_queue_handlers(tmp_path: Path) -> None:
+    log_path = tmp_path / "logs" / "cli.log"
+    logger = configure_logging(log_path, "text", verbose=False)
+    logger.info("before shutdown")
+    shutdown_logging()
+    logger.info("after shutdown")
+
+    for candidate in (logger, logging.getLogger()):
+        assert not any(isinstance(handler, QueueHandler) for handler in candidate.handlers)
+    assert "before shutdown" in log_path.read_text(encoding="utf-8")
+
+
+def test_hash_path_cache_tracks_file_changes(tmp_path: Path) -> None:
+    target = tmp_path / "input.json"
+    target.write_text("{}", encoding="utf-8")
+    first = _hash_path(target)
+    assert _hash_path(target) == first
+
+    target.write_text('{"changed": true}', encoding="utf-8")
+    assert _hash_path(target) != first
+
+
+def test_hash_path_cache_keyed_on_inode_and_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app_module = importlib.import_module("DomainDetermine.cli.app")
+    monkeypatch.setattr(app_module, "_HASH_CACHE", OrderedDict())
+    monkeypatch.setattr(app_module, "_HASH_CACHE_SIZE", 2)
+    old_ns = time.time_ns() - 60_000_000_000
+    target = tmp_path / "input.json"
+    target.write_text('{"v": 1}', encoding="utf-8")
+    os.utime(target, ns=(old_ns, old_ns))
+    first = _hash_path(target)
+
+    # Same size and mtime, swapped in by rename: only the inode differs.
+    replacement = tmp_path / "input.json.tmp"
+    replacement.write_text('{"v": 2}', encoding="utf-8")
+    os.utime(replacement, ns=(old_ns, old_ns))
+    os.replace(replacement, target)
+    assert _hash_path(target) != first
+
+    # A same-size rewrite within one mtime tick is never served from the cache.
+    fresh = tmp_path / "fresh.json"
+    fresh.write_text('{"v": 1}', encoding="utf-8")
+    fresh_first = _hash_path(fresh)
+    mtime_ns = fresh.stat().st_mtime_ns
+    fresh.write_text('{"v": 2}', encoding="utf-8")
+    os.utime(fresh, ns=(mtime_ns, mtime_ns))
+    assert _hash_path(fresh) != fresh_first
+
+    for index in range(4):
+        extra = tmp_path / f"extra-{index}.json"
+        extra.write_text("{}", encoding="utf-8")
+        os.utime(extra, ns=(old_ns, old_ns))
+        _hash_path(extra)
+    assert len(app_module._HASH_CACHE) == 2
+
+
+def test_profile_step_defaults_computed_once_per_command() -> None:
+    app_module = importlib.import_module("DomainDetermine.cli.app")
+    defaults = app_module._command_defaults(app_module.evalgen)
+
+    assert defaults["sample"] == 10
+    assert app_module._command_defaults(app_module.evalgen) is defaults
+
+
+def test_profile_prehash_reads_only_fingerprinted_inputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app_module = importlib.import_module("DomainDetermine.cli.app")
+    hashed = []
+    monkeypatch.setattr(app_module, "_safe_hash_path", hashed.append)
+    manifest = ProfileManifest(
+        name="inputs",
+        cli_version="0.1.0",
+        steps=(
+            ProfileStep("ingest", {"source": str(tmp_path / "source.json")}),
+            ProfileStep(
+                "ingest",
+                {"source": str(tmp_path / "other.json"), "manifest": str(tmp_path / "out")},
+            ),
+            ProfileStep("report", {"name": "weekly", "report": str(tmp_path / "report.html")}),
+        ),
+    )
+
+    app_module._prehash_profile_inputs(manifest)
+
+    assert sorted(hashed) == [tmp_path / "other.json", tmp_path / "source.json"]
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_hash_path_hashes_special_files_by_name(tmp_path: Path) -> None:
+    fifo = tmp_path / "stream"
+    os.mkfifo(fifo)
+    # Opening a FIFO with no writer blocks, so this only returns if it is not read.
+    assert _hash_path(fifo) == hashlib.sha256(str(fifo).encode("utf-8")).hexdigest()
+
+
+def test_write_artifact_compresses_large_payloads(tmp_path: Path) -> None:
+    config_path = write_config(tmp_path)
+    resolved = load_cli_config(
+        config_path,
+        env={"DD_CONTEXT_HOME": str(tmp_path / "state")},
+        overrides={"artifact_compression": "gzip"},
+    )
+
+    small = _write_artifact(resolved, "report", "small", {"name": "small"})
+    assert small.suffix == ".json"
+
+    large = _write_artifact(resolved, "report", "large", {"notes": "x" * 8192})
+    assert large.name == "large.json.gz"
+    assert json.loads(read_artifact_bytes(large))["inputs"]["notes"] == "x" * 8192
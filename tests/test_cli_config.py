@@ -6,7 +6,12 @@ from pathlib import Path
 
 import pytest
 
-from DomainDetermine.cli.config import load_cli_config
+from DomainDetermine.cli.config import (
+    _expand,
+    load_cli_config,
+    read_current_context,
+    write_current_context,
+)
 
 
 def write_config(tmp_path: Path) -> Path:
@@ -112,3 +117,33 @@ def test_env_overrides_policy_guard(tmp_path: Path) -> None:
 # TODO: implement tests for mapping pipeline configuration
 
 
+def test_write_current_context_skips_unchanged_value(tmp_path: Path) -> None:
+    env = {"DD_CONTEXT_HOME": str(tmp_path / "state")}
+    write_current_context(env, "dev")
+    state_file = tmp_path / "state" / "context"
+    first_mtime = state_file.stat().st_mtime_ns
+
+    write_current_context(env, "dev")
+    assert state_file.stat().st_mtime_ns == first_mtime
+
+    write_current_context(env, "prod")
+    assert read_current_context(env) == "prod"
+
+
+def test_load_cli_config_reparses_modified_file(tmp_path: Path) -> None:
+    config_path = write_config(tmp_path)
+    env = {"DD_CONTEXT_HOME": str(tmp_path / "state")}
+    assert load_cli_config(config_path, env=env).context.registry_url == "https://registry.dev"
+
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace("registry.dev", "registry.changed"),
+        encoding="utf-8",
+    )
+    assert load_cli_config(config_path, env=env).context.registry_url == "https://registry.changed"
+
+
+def test_expand_follows_home_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path / "first"))
+    assert _expand("~/artifacts", None) == tmp_path / "first" / "artifacts"
+    monkeypatch.setenv("HOME", str(tmp_path / "second"))
+    assert _expand("~/artifacts", None) == tmp_path / "second" / "artifacts"
@@ -0,0 +1,87 @@
+"""Tests for CLI operation execution and idempotency manifests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from DomainDetermine.cli.config import (
+    ContextConfig,
+    ContextPolicy,
+    PluginTrustPolicy,
+    ResolvedConfig,
+)
+from DomainDetermine.cli.operations import (
+    FINGERPRINT_ALGORITHM,
+    CommandRuntime,
+    OperationExecutor,
+    OperationOutcome,
+)
+
+
+def _make_runtime(tmp_path: Path) -> CommandRuntime:
+    artifact_root = tmp_path / "artifacts"
+    artifact_root.mkdir()
+    context = ContextConfig(name="dev", artifact_root=artifact_root, policy=ContextPolicy())
+    resolved = ResolvedConfig(
+        context=context,
+        contexts={context.name: context},
+        dry_run=False,
+        log_format="json",
+        verbose=False,
+        artifact_root=artifact_root,
+        config_path=None,
+        state_path=tmp_path / "state" / "context",
+        raw_overrides={},
+        plugin_trust=PluginTrustPolicy(allow_unsigned=True),
+    )
+    return CommandRuntime(config=resolved, logger=logging.getLogger("test-cli-operations"))
+
+
+def test_run_records_fingerprint_algorithm_and_skips_repeat(tmp_path: Path) -> None:
+    runtime = _make_runtime(tmp_path)
+    payload = {"source": "input.json", "hash": "abc"}
+
+    first = OperationExecutor(runtime).run(
+        "ingest", "input.json", payload, lambda: None, "preview"
+    )
+    second = OperationExecutor(runtime).run(
+        "ingest", "input.json", payload, lambda: None, "preview"
+    )
+
+    assert first == OperationOutcome.EXECUTED
+    assert second == OperationOutcome.NOOP
+    manifest = json.loads((runtime.artifact_root / ".cli_state" / "ingest.json").read_text())
+    assert manifest["input.json"]["fingerprint_algorithm"] == FINGERPRINT_ALGORITHM
+
+
+def test_legacy_sha256_manifest_entries_remain_current(tmp_path: Path) -> None:
+    runtime = _make_runtime(tmp_path)
+    payload = {"source": "input.json", "hash": "abc"}
+    legacy = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    state_dir = runtime.artifact_root / ".cli_state"
+    state_dir.mkdir()
+    (state_dir / "ingest.json").write_text(
+        json.dumps({"input.json": {"fingerprint": legacy, "payload": payload, "artifact": None}}),
+        encoding="utf-8",
+    )
+
+    outcome = OperationExecutor(runtime).run(
+        "ingest", "input.json", payload, lambda: None, "preview"
+    )
+
+    assert outcome == OperationOutcome.NOOP
+
+
+def test_in_place_payload_change_reruns_operation(tmp_path: Path) -> None:
+    runtime = _make_runtime(tmp_path)
+    executor = OperationExecutor(runtime)
+    payload = {"source": "input.json", "hash": "abc"}
+
+    first = executor.run("ingest", "input.json", payload, lambda: None, "preview")
+    payload["hash"] = "def"
+    second = executor.run("ingest", "input.json", payload, lambda: None, "preview")
+
+    assert first == second == OperationOutcome.EXECUTED
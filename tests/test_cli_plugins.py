@@ -1,6 +1,9 @@
 import hashlib
+import importlib.metadata as metadata
 import inspect
 import logging
+import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -12,7 +15,12 @@ from DomainDetermine.cli.config import (
     ResolvedConfig,
 )
 from DomainDetermine.cli.operations import CommandRuntime
-from DomainDetermine.cli.plugins import PluginExecutionError, PluginRegistry
+from DomainDetermine.cli.plugins import (
+    PluginExecutionError,
+    PluginRegistry,
+    describe_plugin_trust,
+    sandbox_directory,
+)
 
 
 def sample_loader(*, runtime, source: str) -> str:
@@ -91,3 +99,147 @@ def test_unsigned_plugins_allowed_when_policy_permits(tmp_path):
     )
     assert result == "processed:input.json"
 
+
+
+def test_list_all_matches_per_category_listing():
+    registry = PluginRegistry()
+    registry.register("loaders", sample_loader)
+    logger = logging.getLogger("test-cli-plugin")
+
+    listing = registry.list_all(logger)
+
+    assert list(listing) == list(registry.categories)
+    for category, wrappers in listing.items():
+        expected = registry.list_plugins(category, logger)
+        assert [wrapper.name for wrapper in wrappers] == [wrapper.name for wrapper in expected]
+    assert [wrapper.name for wrapper in listing["loaders"]] == ["sample_loader"]
+
+
+def test_entry_point_scan_shared_until_invalidated(monkeypatch):
+    registry = PluginRegistry()
+    logger = logging.getLogger("test-cli-plugin")
+    calls = []
+    original = metadata.entry_points
+
+    def counting_entry_points(**kwargs):
+        calls.append(kwargs)
+        return original(**kwargs)
+
+    monkeypatch.setattr(metadata, "entry_points", counting_entry_points)
+
+    registry.list_plugins("loaders", logger)
+    registry.list_plugins("loaders", logger)
+    registry.list_all(logger)
+    assert len(calls) == 1
+
+    registry.register("loaders", sample_loader)
+    assert [wrapper.name for wrapper in registry.list_plugins("loaders", logger)] == [
+        "sample_loader"
+    ]
+    assert len(calls) == 1
+
+    registry.invalidate()
+    registry.list_plugins("loaders", logger)
+    assert len(calls) == 2
+
+
+def test_entry_point_plugins_import_on_first_execute(tmp_path, monkeypatch):
+    module_path = tmp_path / "dd_lazy_loader.py"
+    module_path.write_text(
+        "def lazy_loader(*, runtime, source):\n    return f'lazy:{source}'\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    entry_point = metadata.EntryPoint(
+        name="lazy_loader",
+        value="dd_lazy_loader:lazy_loader",
+        group="cli.plugins.loaders",
+    )
+    monkeypatch.setattr(metadata, "entry_points", lambda: metadata.EntryPoints([entry_point]))
+    monkeypatch.delitem(sys.modules, "dd_lazy_loader", raising=False)
+    registry = PluginRegistry()
+    logger = logging.getLogger("test-cli-plugin")
+
+    listed = registry.list_plugins("loaders", logger)
+    assert [wrapper.name for wrapper in listed] == ["lazy_loader"]
+    assert "dd_lazy_loader" not in sys.modules
+
+    runtime = _make_runtime(tmp_path, PluginTrustPolicy(allow_unsigned=True))
+    result = registry.execute("loaders", "lazy_loader", runtime, {"source": "x"}, logger)
+    assert result == "lazy:x"
+    assert listed[0].digest == hashlib.sha256(module_path.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize("allow_unsigned", [False, True])
+def test_broken_allowlisted_entry_point_reported_when_listing(
+    tmp_path, monkeypatch, caplog, allow_unsigned
+):
+    entry_point = metadata.EntryPoint(
+        name="broken_loader",
+        value="dd_missing_plugin_module:loader",
+        group="cli.plugins.loaders",
+    )
+    monkeypatch.setattr(metadata, "entry_points", lambda: metadata.EntryPoints([entry_point]))
+    trust = PluginTrustPolicy(
+        allow_unsigned=allow_unsigned, signature_allowlist={"broken_loader": "0" * 64}
+    )
+    registry = PluginRegistry()
+    logger = logging.getLogger("test-cli-plugin")
+
+    with caplog.at_level(logging.ERROR, logger="test-cli-plugin"):
+        listing = registry.list_all(logger, trust)
+    assert [wrapper.name for wrapper in listing["loaders"]] == ["broken_loader"]
+    assert describe_plugin_trust(listing["loaders"][0], trust) == "load-error"
+    assert [record.getMessage() for record in caplog.records] == ["Failed to load plugin"]
+
+    runtime = _make_runtime(tmp_path, trust)
+    with pytest.raises(PluginExecutionError, match="Failed to load plugin"):
+        registry.execute("loaders", "broken_loader", runtime, {}, logger)
+
+
+def test_payload_deep_copied_only_for_mutating_plugins(tmp_path):
+    def appending_loader(*, runtime, items):
+        items.append("plugin")
+        return len(items)
+
+    registry = PluginRegistry()
+    registry.register("loaders", appending_loader)
+    runtime = _make_runtime(tmp_path, PluginTrustPolicy(allow_unsigned=True))
+    logger = logging.getLogger("test-cli-plugin")
+
+    payload = {"items": []}
+    registry.execute("loaders", "appending_loader", runtime, payload, logger)
+    assert payload["items"] == ["plugin"]
+
+    appending_loader.mutates_payload = True
+    registry.register("loaders", appending_loader)
+    payload = {"items": []}
+    registry.execute("loaders", "appending_loader", runtime, payload, logger)
+    assert payload["items"] == []
+
+
+def test_sandbox_directory_exposed_without_touching_environment(tmp_path, monkeypatch):
+    seen = {}
+
+    def scratch_loader(*, runtime):
+        directory = sandbox_directory()
+        seen["dir"] = directory
+        seen["exists"] = directory is not None and directory.is_dir()
+        seen["env"] = os.environ.get("DD_PLUGIN_SANDBOX_DIR")
+        return "ok"
+
+    monkeypatch.delenv("DD_PLUGIN_SANDBOX_DIR", raising=False)
+    registry = PluginRegistry()
+    registry.register("loaders", scratch_loader)
+    runtime = _make_runtime(tmp_path, PluginTrustPolicy(allow_unsigned=True))
+    logger = logging.getLogger("test-cli-plugin")
+
+    registry.execute("loaders", "scratch_loader", runtime, {}, logger)
+    assert seen["exists"] and seen["env"] is None
+    assert sandbox_directory() is None
+
+    scratch_loader.needs_subprocess = True
+    registry.register("loaders", scratch_loader)
+    registry.execute("loaders", "scratch_loader", runtime, {}, logger)
+    assert seen["env"] == str(seen["dir"])
+    assert "DD_PLUGIN_SANDBOX_DIR" not in os.environ
@@ -4,6 +4,8 @@ cli_app = importlib.import_module("DomainDetermine.cli.app")
 from DomainDetermine.cli.profiles import (  # noqa: E402
     ProfileManifest,
     ProfileStep,
+    load_profile,
+    schedule_profile_steps,
     validate_profile,
 )
 
@@ -47,3 +49,50 @@ def test_profile_validation_passes_valid_manifest():
     errors = validate_profile(manifest, _resolver)
     assert errors == []
 
+
+
+def test_schedule_profile_steps_groups_independent_steps():
+    manifest = ProfileManifest(
+        name="waves",
+        cli_version=cli_app.CLI_VERSION,
+        steps=(
+            ProfileStep(verb="ingest", arguments={"source": "a.json"}, identifier="a"),
+            ProfileStep(verb="ingest", arguments={"source": "b.json"}),
+            ProfileStep(verb="plan", arguments={"plan_spec": "plan.toml"}, depends_on=("a", "2")),
+        ),
+    )
+    waves = schedule_profile_steps(manifest)
+    assert [[step.verb for step in wave] for wave in waves] == [["ingest", "ingest"], ["plan"]]
+    assert validate_profile(manifest, _resolver) == []
+
+
+def test_profile_validation_detects_dependency_cycles():
+    manifest = ProfileManifest(
+        name="cycle",
+        cli_version=cli_app.CLI_VERSION,
+        steps=(
+            ProfileStep(
+                verb="ingest", arguments={"source": "a.json"}, identifier="a", depends_on=("b",)
+            ),
+            ProfileStep(
+                verb="plan", arguments={"plan_spec": "p.toml"}, identifier="b", depends_on=("a",)
+            ),
+        ),
+    )
+    errors = validate_profile(manifest, _resolver)
+    assert any("circular step dependencies" in error for error in errors)
+
+
+def test_load_profile_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "profile.toml"
+    path.write_text(
+        'name = "demo"\n[[steps]]\nverb = "ingest"\nsource = "a.json"\n', encoding="utf-8"
+    )
+
+    first = load_profile(path)
+    assert load_profile(path) is first
+
+    path.write_text(
+        'name = "demo"\n[[steps]]\nverb = "ingest"\nsource = "changed.json"\n', encoding="utf-8"
+    )
+    assert load_profile(path).steps[0].arguments == {"source": "changed.json"}
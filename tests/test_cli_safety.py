@@ -0,0 +1,147 @@
+"""Tests for CLI preflight safety checks."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from DomainDetermine.cli import safety
+from DomainDetermine.cli.config import ContextPolicy
+from DomainDetermine.cli.safety import (
+    PreflightChecks,
+    PreflightError,
+    validate_credentials_reference,
+)
+
+
+def _checks(policy: ContextPolicy) -> PreflightChecks:
+    return PreflightChecks(policy, logging.getLogger("test-cli-safety"), environment={})
+
+
+def test_integrity_markers_pass_when_present(tmp_path: Path) -> None:
+    first = tmp_path / "first.ok"
+    second = tmp_path / "second.ok"
+    first.write_text("ok", encoding="utf-8")
+    second.write_text("ok", encoding="utf-8")
+    (tmp_path / "nested").mkdir()
+
+    policy = ContextPolicy(integrity_markers=(first, second, tmp_path / "nested"))
+    _checks(policy).run("publish", {})
+
+
+def test_integrity_markers_report_missing_and_empty(tmp_path: Path) -> None:
+    present = tmp_path / "present.ok"
+    present.write_text("ok", encoding="utf-8")
+    empty = tmp_path / "empty.ok"
+    empty.touch()
+
+    missing_policy = ContextPolicy(integrity_markers=(present, tmp_path / "absent" / "missing.ok"))
+    with pytest.raises(PreflightError, match="Integrity marker missing"):
+        _checks(missing_policy).run("publish", {})
+
+    dangling = tmp_path / "dangling.ok"
+    dangling.symlink_to(tmp_path / "gone.ok")
+    for marker in (dangling, present / "child.ok"):
+        with pytest.raises(PreflightError, match="Integrity marker missing"):
+            _checks(ContextPolicy(integrity_markers=(marker,))).run("publish", {})
+
+    empty_policy = ContextPolicy(integrity_markers=(present, empty))
+    with pytest.raises(PreflightError, match="Integrity marker empty"):
+        _checks(empty_policy).run("publish", {})
+
+
+def test_integrity_markers_unstattable_reported_missing(tmp_path: Path) -> None:
+    loop = tmp_path / "loop.ok"
+    loop.symlink_to(loop)
+    too_long = tmp_path / ("x" * 1024)
+    for marker in (loop, too_long):
+        checks = _checks(ContextPolicy(integrity_markers=(marker,)))
+        with pytest.raises(PreflightError, match="missing"):
+            checks.run("publish", {"artifact": "x"})
+
+
+def test_forbidden_topics_detected_across_nested_values() -> None:
+    policy = ContextPolicy(forbidden_topics=("Weapons", "bio hazard"))
+    checks = _checks(policy)
+    checks.run("plan", {"source": "safe.json", "nested": {"topic": "weap", "other": "ons"}})
+    with pytest.raises(PreflightError, match="weapons"):
+        checks.run("plan", {"source": "safe.json", "nested": {"topic": "Weapons export"}})
+    with pytest.raises(PreflightError, match="bio hazard"):
+        checks.run("plan", {"source": "safe.json", "notes": ["fine", "About BIO HAZARD labs"]})
+
+
+def test_forbidden_topic_located_when_values_contain_nul(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    checks = _checks(ContextPolicy(forbidden_topics=("secret topic",)))
+    with (
+        caplog.at_level(logging.ERROR, logger="test-cli-safety"),
+        pytest.raises(PreflightError, match="secret topic"),
+    ):
+        checks.run("plan", {"notes": ["notes a\x00b\x00c here", "the secret topic"]})
+    assert caplog.records[-1].value == "the secret topic"
+
+
+def test_preflight_cache_reuses_pass_only_when_enabled(tmp_path: Path) -> None:
+    marker = tmp_path / "ready.ok"
+    marker.write_text("ok", encoding="utf-8")
+    policy = ContextPolicy(integrity_markers=(marker,))
+    logger = logging.getLogger("test-cli-safety")
+    cached = PreflightChecks(policy, logger, environment={"DD_PREFLIGHT_CACHE_TTL": "60"})
+    cached.run("publish", {"artifact": "cached"})
+
+    marker.unlink()
+    cached.run("publish", {"artifact": "cached"})
+    with pytest.raises(PreflightError, match="missing"):
+        cached.run("publish", {"artifact": "other"})
+    with pytest.raises(PreflightError, match="missing"):
+        _checks(policy).run("publish", {"artifact": "cached"})
+
+
+def test_preflight_cache_evicts_expired_and_bounds_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(safety, "_PASSED_PREFLIGHTS", OrderedDict())
+    monkeypatch.setattr(safety, "_PASSED_PREFLIGHTS_SIZE", 2)
+    logger = logging.getLogger("test-cli-safety")
+    policy = ContextPolicy()
+    short = PreflightChecks(policy, logger, environment={"DD_PREFLIGHT_CACHE_TTL": "0.01"})
+    short.run("publish", {"artifact": "short-lived"})
+    time.sleep(0.02)
+
+    cached = PreflightChecks(policy, logger, environment={"DD_PREFLIGHT_CACHE_TTL": "60"})
+    cached.run("publish", {"artifact": "first"})
+    assert len(safety._PASSED_PREFLIGHTS) == 1
+    for artifact in ("second", "third", "fourth"):
+        cached.run("publish", {"artifact": artifact})
+    assert len(safety._PASSED_PREFLIGHTS) == 2
+
+
+@pytest.mark.parametrize("ttl", ["60s", "inf", "nan"])
+def test_preflight_cache_disabled_for_invalid_ttl(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, ttl: str
+) -> None:
+    marker = tmp_path / "ready.ok"
+    marker.write_text("ok", encoding="utf-8")
+    policy = ContextPolicy(integrity_markers=(marker,))
+    logger = logging.getLogger("test-cli-safety")
+    with caplog.at_level(logging.WARNING, logger="test-cli-safety"):
+        checks = PreflightChecks(policy, logger, environment={"DD_PREFLIGHT_CACHE_TTL": ttl})
+    assert "DD_PREFLIGHT_CACHE_TTL" in caplog.text
+
+    checks.run("publish", {"artifact": "cached"})
+    marker.unlink()
+    with pytest.raises(PreflightError, match="missing"):
+        checks.run("publish", {"artifact": "cached"})
+
+
+def test_credentials_reference_requires_env_token_or_uri_scheme() -> None:
+    for reference in ("env:REGISTRY_TOKEN", "vault://kv/registry", "aws-sm://registry/token"):
+        validate_credentials_reference(reference)
+    for reference in ("hunter2", "://missing-scheme", "token env:VAR", "1vault://kv"):
+        with pytest.raises(ValueError, match="env:VAR"):
+            validate_credentials_reference(reference)
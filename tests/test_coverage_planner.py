@@ -156,7 +156,7 @@ def test_blocked_jurisdiction_is_excluded(sample_concepts, facet_config, constra
 
 
 def test_cost_constrained_uses_lp_solver(sample_concepts, facet_config, policy_constraint):
-    pytest.importorskip("pulp")
+    pytest.importorskip("scipy")
     constraints = ConstraintConfig(
         total_items=20,
         allocation_strategy="cost_constrained",
@@ -185,7 +185,7 @@ def test_cost_constrained_uses_lp_solver(sample_concepts, facet_config, policy_c
 
 
 def test_cost_constrained_records_failure_and_fallback(sample_concepts, facet_config, policy_constraint):
-    pytest.importorskip("pulp")
+    pytest.importorskip("scipy")
     constraints = ConstraintConfig(
         total_items=1,
         branch_minimums={"antitrust": 3},